@@ -56,6 +56,21 @@ MERGED_DATA_DIR: Path = PROJECT_ROOT / "data" / "merged"
 # about every dataset that has been ingested.
 REGISTRY_PATH: Path = PROCESSED_DATA_DIR / "registry.json"
 
+# ---------------------------------------------------------------------------
+# Profiling
+# ---------------------------------------------------------------------------
+
+# Default cap on the number of rows whose values the schema profiler
+# inspects.  Type and missingness estimates converge long before this on
+# real data.  Defined here, not in ingestion/schema.py, so the CLI can use
+# it without importing pandas.
+DEFAULT_PROFILE_SAMPLE_ROWS: int = 1_000_000
+
+# Output files are not fsync'd by default: a crash may lose the last write,
+# but every run is reproducible from the raw inputs.  Set NORP_FSYNC=1 to
+# flush each profile to disk before the run reports success.
+FSYNC_OUTPUTS: bool = os.environ.get("NORP_FSYNC") == "1"
+
 # ---------------------------------------------------------------------------
 # Ensure data directories exist
 # ---------------------------------------------------------------------------
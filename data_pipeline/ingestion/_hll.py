@@ -0,0 +1,96 @@
+"""
+HyperLogLog Sketch
+==================
+
+Fixed-memory distinct-value estimator used by :class:`SchemaProfiler` to
+report per-column cardinality while streaming, without holding every
+value seen.
+
+Architectural notes:
+    - Values are hashed with ``pandas.util.hash_array`` (64-bit, vectorized,
+      stable across processes), and register updates are a single
+      ``np.maximum.at`` per chunk, so there is no Python loop per value.
+      ``categorize=False`` skips hash_array's factorize step, which costs
+      more than it saves: callers often pass already-distinct values.
+      Nested values (lists, dicts) that ``hash_array`` rejects are hashed
+      by their ``repr`` instead.
+    - With the default precision of 14 the sketch is 16 KiB per column
+      and the standard error is about 0.8 %.  Small cardinalities use
+      linear counting, which is close to exact.
+    - Until 10,000 values have been added, the sketch also keeps the set of
+      distinct hashes, so small columns get an exact count instead of an
+      estimate.  The set is dropped once the limit is passed, leaving
+      memory fixed at the register array.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Number of index bits; the sketch keeps 2 ** precision one-byte registers.
+_DEFAULT_PRECISION: int = 14
+
+# Values added before the exact distinct-hash set is abandoned.
+_EXACT_LIMIT: int = 10_000
+
+
+class HyperLogLog:
+    """Approximate distinct counter over hashed values.
+
+    Parameters
+    ----------
+    precision : int, optional
+        Number of hash bits used to pick a register (4–18).
+    """
+
+    __slots__ = ("_p", "_m", "_registers", "_exact", "_n_seen")
+
+    def __init__(self, precision: int = _DEFAULT_PRECISION) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision}")
+        self._p = precision
+        self._m = 1 << precision
+        self._registers = np.zeros(self._m, dtype=np.uint8)
+        self._exact: Optional[np.ndarray] = np.empty(0, dtype=np.uint64)
+        self._n_seen = 0
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a 1-D array of non-null values to the sketch."""
+        if len(values) == 0:
+            return
+        try:
+            hashes = pd.util.hash_array(np.asarray(values), categorize=False)
+        except (TypeError, ValueError):
+            # Nested values (lists, dicts, arrays) have no vectorized hash;
+            # hash their text form instead.
+            text = np.array([repr(v) for v in values], dtype=object)
+            hashes = pd.util.hash_array(text, categorize=False)
+        self._n_seen += len(hashes)
+        if self._exact is not None:
+            self._exact = (
+                np.union1d(self._exact, hashes)
+                if self._n_seen < _EXACT_LIMIT else None
+            )
+        idx = (hashes >> np.uint64(64 - self._p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - self._p)) - 1)
+        # Rank = position of the leftmost 1-bit in the remaining bits.
+        # frexp's exponent is the bit length (0 for rest == 0).
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (64 - self._p + 1 - bit_length).astype(np.uint8)
+        np.maximum.at(self._registers, idx, rank)
+
+    def estimate(self) -> int:
+        """Return the estimated number of distinct values added.
+
+        Exact while fewer than ``_EXACT_LIMIT`` values have been added.
+        """
+        if self._exact is not None:
+            return len(self._exact)
+        m = self._m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.ldexp(1.0, -self._registers.astype(np.int64)).sum()
+        zeros = int(np.count_nonzero(self._registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return int(round(m * np.log(m / zeros)))
+        return int(round(raw))
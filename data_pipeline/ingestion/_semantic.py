@@ -0,0 +1,119 @@
+"""
+Semantic Type Patterns
+======================
+
+Recognizes common semantic string types (email, URL, IP address, phone
+number, ZIP code) in a batch of cell values, for the ``semantic_types``
+section of the schema profile.
+
+Architectural notes:
+    - Every pattern is anchored to the whole cell and matched
+      case-insensitively.  Patterns stay within the regex subset that
+      Hyperscan supports (no look-arounds or back-references).
+    - When ``hyperscan`` is installed, all patterns are compiled once into
+      a single multi-pattern database.  A batch is joined into one
+      newline-separated buffer and scanned in a single pass, with ``^`` /
+      ``$`` matching at line boundaries.  Each cell is read once no matter
+      how many patterns there are.  A Hyperscan scratch space can only
+      serve one scan at a time, and the profiler scans columns on a thread
+      pool, so each thread allocates its own scratch on first use.
+    - Without hyperscan, the patterns are combined into one alternation
+      and each cell is matched with a single ``re.fullmatch``.  Alternatives
+      are tried in declaration order, so the more specific types come
+      first.
+"""
+
+import re
+import threading
+from typing import Sequence
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None  # hyperscan not installed; use the combined re pattern
+
+# Semantic type → pattern, most specific first.
+_PATTERNS: dict[str, str] = {
+    "email": r"[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}",
+    "url": r"(?:https?://|www\.)[^\s]+",
+    "ip_address": (
+        r"(?:(?:25[0-5]|2[0-4][0-9]|1?[0-9]?[0-9])\.){3}"
+        r"(?:25[0-5]|2[0-4][0-9]|1?[0-9]?[0-9])"
+    ),
+    "phone": r"(?:\+?1[-. ]?)?\(?[0-9]{3}\)?[-. ]?[0-9]{3}[-. ]?[0-9]{4}",
+    "zip_code": r"[0-9]{5}(?:-[0-9]{4})?",
+}
+
+SEMANTIC_TYPES: tuple[str, ...] = tuple(_PATTERNS)
+
+
+def _build_hyperscan_db():
+    """Compile every pattern into one Hyperscan block-mode database."""
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE
+    db.compile(
+        expressions=[f"^(?:{p})$".encode() for p in _PATTERNS.values()],
+        ids=list(range(len(_PATTERNS))),
+        elements=len(_PATTERNS),
+        flags=[flags] * len(_PATTERNS),
+    )
+    return db
+
+
+_HS_DB = _build_hyperscan_db() if hyperscan is not None else None
+
+# Per-thread Hyperscan scratch space (see _hs_scratch).
+_HS_LOCAL = threading.local()
+
+_COMBINED_RE = re.compile(
+    "|".join(f"(?P<{name}>{p})" for name, p in _PATTERNS.items()),
+    re.IGNORECASE,
+)
+
+
+def _hs_scratch():
+    """Return this thread's scratch space for :data:`_HS_DB`."""
+    scratch = getattr(_HS_LOCAL, "scratch", None)
+    if scratch is None:
+        scratch = _HS_LOCAL.scratch = hyperscan.Scratch(_HS_DB)
+    return scratch
+
+
+def count_semantic_matches(values: Sequence[str]) -> dict[str, int]:
+    """Count how many of *values* match each semantic type.
+
+    Parameters
+    ----------
+    values : sequence of str
+        Non-null cell values, already converted to ``str``.
+
+    Returns
+    -------
+    dict[str, int]
+        Semantic type → number of values that match it in full.
+    """
+    counts = dict.fromkeys(SEMANTIC_TYPES, 0)
+    if not len(values):
+        return counts
+
+    if _HS_DB is not None:
+        hits = [0] * len(SEMANTIC_TYPES)
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits[pattern_id] += 1
+
+        # One cell per line; embedded newlines could never match anyway.
+        buffer = "\n".join(v.strip().replace("\n", " ") for v in values)
+        _HS_DB.scan(
+            buffer.encode("utf-8"),
+            match_event_handler=on_match,
+            scratch=_hs_scratch(),
+        )
+        return dict(zip(SEMANTIC_TYPES, hits))
+
+    fullmatch = _COMBINED_RE.fullmatch
+    for value in values:
+        match = fullmatch(value.strip())
+        if match is not None:
+            counts[match.lastgroup] += 1
+    return counts
@@ -0,0 +1,64 @@
+"""
+Ahead-of-Time Build for the Stats Kernel
+========================================
+
+Compiles :func:`._stats_numba.col_moments` into the ``_stats_aot`` extension
+module with ``numba.pycc``, so a one-shot CLI run imports machine code
+instead of paying Numba's JIT compile on its first profile.
+
+Run once per environment (after installing ``numba``)::
+
+    python -m data_pipeline.ingestion._stats_aot_build
+
+Architectural notes:
+    - The build reuses the kernel's pure-Python source (``py_func``), so the
+      AOT and JIT versions can never drift apart.
+    - ``pycc`` does not support ``parallel=True``; the exported kernel runs
+      ``prange`` as a plain loop.  It trades the JIT version's threads for
+      zero start-up cost, which wins for the small and mid-sized files a
+      single ingest usually sees.
+    - :class:`SchemaProfiler` imports ``_stats_aot`` first and falls back to
+      the JIT kernel, then to numpy, so the built extension is optional.
+"""
+
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Signature of col_moments: (n_columns, n_rows) C-contiguous float64 block,
+# then the min / max / mean / M2 / null-count output arrays.
+_COL_MOMENTS_SIG = "void(f8[:, ::1], f8[:], f8[:], f8[:], f8[:], i8[:])"
+
+
+def build(output_dir: Path | None = None) -> None:
+    """Compile the ``_stats_aot`` extension next to this module.
+
+    Parameters
+    ----------
+    output_dir : Path, optional
+        Where to write the extension (defaults to this package directory).
+
+    Raises
+    ------
+    RuntimeError
+        If ``numba`` is not installed.
+    """
+    from data_pipeline.ingestion._stats_numba import col_moments
+
+    if col_moments is None:
+        raise RuntimeError("numba is required to build the _stats_aot extension")
+    from numba.pycc import CC
+
+    cc = CC("_stats_aot")
+    cc.output_dir = str(output_dir or Path(__file__).resolve().parent)
+    cc.export("col_moments", _COL_MOMENTS_SIG)(col_moments.py_func)
+    cc.compile()
+    logger.info("Built %s/_stats_aot extension", cc.output_dir)
+
+
+if __name__ == "__main__":
+    from data_pipeline.config import setup_logging
+
+    setup_logging()
+    build()
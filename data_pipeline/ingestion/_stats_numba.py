@@ -0,0 +1,77 @@
+"""
+Numeric Column Statistics Kernel
+================================
+
+Fused min / max / mean / sum-of-squared-deviations / null-count scan over a
+block of numeric columns, used by :class:`SchemaProfiler` to summarize every
+numeric column in one call.
+
+Architectural notes:
+    - Numba does not understand pandas objects, so the kernel takes a raw
+      2-D ``float64`` array laid out as ``(n_columns, n_rows)`` in C order,
+      i.e. one contiguous row per DataFrame column.  Columns are scanned in
+      parallel (``prange``).
+    - Each column is walked twice: once for min / max / mean, once for the
+      sum of squared deviations from that mean (``M2``).  A single-pass
+      raw sum of squares cancels catastrophically for large values with a
+      small spread (EINs, epoch timestamps); the second pass over a
+      contiguous, cache-resident row is cheap by comparison.  Chunks are
+      combined by the caller with Chan's parallel formula.
+    - Results are written into caller-owned output arrays, so the same
+      signature can be compiled ahead of time.  A column with no non-null
+      values gets ``NaN`` for its min and max and ``0`` for mean and M2.
+    - ``numba`` is optional.  When it is not installed ``col_moments`` is
+      ``None``; :func:`._stats_numpy.col_moments_numpy` computes the same
+      outputs with vectorized numpy reductions and is also used for small
+      blocks, where the kernel's dispatch overhead is not worth paying.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None  # numba not installed; callers use _stats_numpy
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def col_moments(arr2d, out_min, out_max, out_mean, out_m2, out_nulls):
+        """Write the min, max, mean, sum of squared deviations and NaN
+        count of each row of ``arr2d``."""
+        n_cols, n_rows = arr2d.shape
+        for j in prange(n_cols):
+            lo = np.inf
+            hi = -np.inf
+            total = 0.0
+            n_null = 0
+            for i in range(n_rows):
+                v = arr2d[j, i]
+                if np.isnan(v):
+                    n_null += 1
+                else:
+                    if v < lo:
+                        lo = v
+                    if v > hi:
+                        hi = v
+                    total += v
+            mean = 0.0
+            m2 = 0.0
+            if n_null == n_rows:
+                lo = np.nan
+                hi = np.nan
+            else:
+                mean = total / (n_rows - n_null)
+                for i in range(n_rows):
+                    v = arr2d[j, i]
+                    if not np.isnan(v):
+                        m2 += (v - mean) * (v - mean)
+            out_min[j] = lo
+            out_max[j] = hi
+            out_mean[j] = mean
+            out_m2[j] = m2
+            out_nulls[j] = n_null
+
+else:
+    col_moments = None
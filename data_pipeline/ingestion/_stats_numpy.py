@@ -0,0 +1,49 @@
+"""
+Numeric Column Statistics (numpy)
+=================================
+
+Vectorized numpy version of the :func:`._stats_numba.col_moments` kernel,
+used by :class:`SchemaProfiler` for small blocks and whenever no compiled
+kernel is available.
+
+Architectural notes:
+    - Kept apart from :mod:`._stats_numba` so importing it never loads
+      ``numba``; the profiler only imports the JIT module when the
+      ahead-of-time ``_stats_aot`` build is missing.
+    - Takes the same ``(n_columns, n_rows)`` ``float64`` block and
+      caller-owned output arrays as the kernel and produces the same
+      results: ``NaN`` min / max and ``0`` mean / M2 for a column with no
+      non-null values.
+"""
+
+import numpy as np
+
+
+def col_moments_numpy(
+    arr2d: np.ndarray,
+    out_min: np.ndarray,
+    out_max: np.ndarray,
+    out_mean: np.ndarray,
+    out_m2: np.ndarray,
+    out_nulls: np.ndarray,
+) -> None:
+    """Reference implementation of :func:`col_moments` using numpy.
+
+    ``fmin`` / ``fmax`` skip NaNs and only return NaN for an all-NaN
+    column, matching the kernel without emitting warnings.
+    """
+    if arr2d.shape[1] == 0:
+        out_min[:] = np.nan
+        out_max[:] = np.nan
+        out_mean[:] = 0.0
+        out_m2[:] = 0.0
+        out_nulls[:] = 0
+        return
+    nulls = np.isnan(arr2d).sum(axis=1)
+    n_valid = arr2d.shape[1] - nulls
+    mean = np.nansum(arr2d, axis=1) / np.maximum(n_valid, 1)
+    out_min[:] = np.fmin.reduce(arr2d, axis=1)
+    out_max[:] = np.fmax.reduce(arr2d, axis=1)
+    out_mean[:] = mean
+    out_m2[:] = np.nansum(np.square(arr2d - mean[:, None]), axis=1)
+    out_nulls[:] = nulls
@@ -10,20 +10,56 @@ Architectural notes:
       This keeps the logic transparent and avoids silent misdetection.
     - Encoding fallback uses ``latin-1`` after ``utf-8`` fails, which covers
       the vast majority of government / nonprofit data exports.
+    - CSVs are parsed with PyArrow's multi-threaded reader when ``pyarrow``
+      is installed, falling back to ``pd.read_csv`` otherwise.  The PyArrow
+      path returns Arrow-backed columns (``pd.ArrowDtype``), so strings skip
+      the slow Python-object conversion.  Columns that Arrow would infer as
+      dates/timestamps are kept as strings so both paths hand the same raw
+      values downstream.
     - Column normalization is intentionally limited to cosmetic formatting
       (lowercase, strip, underscore) so that downstream cleaning modules
       retain full control over semantic transformations.
+    - Columnar inputs (Parquet, Feather / Arrow IPC) are read by PyArrow
+      with memory mapping and handed to pandas as Arrow-backed columns, so
+      the data is mapped from the page cache rather than copied.
+    - :meth:`DatasetLoader.load_lazy` returns a Polars ``LazyFrame`` over
+      the file instead, for callers that only aggregate (e.g. the profile)
+      and never need rows in memory.  ``polars`` is optional.
     - The loader returns a *raw* DataFrame — no rows are dropped, no types
       are cast, and no values are modified beyond column headers.
 """
 
+import codecs
+import json
 import logging
 import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None  # pyarrow not installed; fall back to pd.read_csv
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed; use the stdlib json module
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None  # polars not installed; load_lazy() is unavailable
+
+try:
+    from python_calamine import CalamineError
+except ImportError:
+    CalamineError = ValueError  # python-calamine not installed; nothing to catch
+
 logger = logging.getLogger(__name__)
 
 # Supported file extensions mapped to their canonical type name.
@@ -33,8 +69,21 @@ _EXTENSION_MAP: dict[str, str] = {
     ".xls": "excel",
     ".xlsx": "excel",
     ".json": "json",
+    ".parquet": "parquet",
+    ".feather": "arrow",   # Feather is the Arrow IPC file format
+    ".arrow": "arrow",
 }
 
+# Block size handed to the PyArrow CSV reader.  Each block is tokenized on
+# its own thread, so 8 MiB keeps every core busy even on mid-sized files.
+_CSV_BLOCK_SIZE: int = 8 << 20
+
+# Interior whitespace runs collapsed to "_" during column normalization.
+_WS_RE = re.compile(r"\s+")
+
+# Default number of rows per chunk for :meth:`DatasetLoader.iter_chunks`.
+_DEFAULT_CHUNKSIZE: int = 1_000_000
+
 
 class DatasetLoader:
     """Load a raw dataset from disk and apply column-name normalization.
@@ -43,6 +92,8 @@ class DatasetLoader:
         - CSV  (``.csv``, ``.tsv``)
         - Excel (``.xls``, ``.xlsx``)
         - JSON (``.json``)
+        - Parquet (``.parquet``) and Feather / Arrow IPC (``.feather``,
+          ``.arrow``) — requires ``pyarrow``
 
     Usage::
 
@@ -67,8 +118,12 @@ class DatasetLoader:
         self.file_path: Path = Path(file_path).resolve()
         self.file_type: Optional[str] = None
 
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"Data file not found: {self.file_path}")
+        try:
+            self._stat: os.stat_result = self.file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Data file not found: {self.file_path}"
+            ) from None
 
         logger.info("DatasetLoader initialized for: %s", self.file_path)
 
@@ -99,6 +154,8 @@ class DatasetLoader:
             "csv": self._load_csv,
             "excel": self._load_excel,
             "json": self._load_json,
+            "parquet": self._load_columnar,
+            "arrow": self._load_columnar,
         }[self.file_type]
 
         df: pd.DataFrame = reader()
@@ -106,16 +163,213 @@ class DatasetLoader:
         # Apply column normalization.
         df = self._normalize_columns(df)
 
-        # Log summary statistics.
-        file_size = os.path.getsize(self.file_path)
+        # Log summary statistics (the thousands-separated size is only
+        # formatted when INFO is actually enabled).
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Load complete — file_size=%s bytes, rows=%d, columns=%d",
+                f"{self._stat.st_size:,}",
+                len(df),
+                len(df.columns),
+            )
+
+        return df
+
+    def iter_chunks(
+        self, chunksize: int = _DEFAULT_CHUNKSIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the dataset as column-normalized DataFrame chunks.
+
+        CSV/TSV files are streamed ``chunksize`` rows at a time, so peak
+        memory is bounded by the chunk rather than the file.  Parquet is
+        streamed in row batches of the same size and Feather / Arrow IPC
+        one stored record batch at a time.  Excel and JSON files cannot be
+        streamed and are yielded as a single chunk.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of rows per chunk (default 1,000,000).
+
+        Yields
+        ------
+        pd.DataFrame
+            Consecutive row blocks with normalized column names.
+        """
+        self.file_type = self._detect_file_type()
+        if self.file_type in ("parquet", "arrow"):
+            for batch in self._iter_columnar_batches(chunksize):
+                yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+            return
+        if self.file_type != "csv":
+            yield self.load()
+            return
+
+        sep = "\t" if self.file_path.suffix.lower() == ".tsv" else ","
+        encoding = self._detect_encoding()
         logger.info(
-            "Load complete — file_size=%s bytes, rows=%d, columns=%d",
-            f"{file_size:,}",
-            len(df),
-            len(df.columns),
+            "Streaming CSV in chunks of %d rows (encoding: %s)",
+            chunksize,
+            encoding,
         )
 
-        return df
+        with pd.read_csv(
+            self.file_path, sep=sep, encoding=encoding, chunksize=chunksize,
+        ) as reader:
+            for chunk in reader:
+                yield self._normalize_columns(chunk)
+
+    def load_lazy(self) -> "pl.LazyFrame":
+        """Return a Polars ``LazyFrame`` scanning a CSV/TSV, Parquet or
+        Feather file.
+
+        Nothing is read until the frame is collected.  Column names are
+        normalized exactly as in :meth:`load`.  Polars reads UTF-8 only, so
+        CSVs detected as latin-1 are scanned with lossy decoding (invalid
+        bytes become U+FFFD).  Feather files must be Arrow IPC (Feather V2);
+        check :attr:`supports_lazy_scan` first.
+
+        Returns
+        -------
+        pl.LazyFrame
+            A lazy scan with normalized column names.
+
+        Raises
+        ------
+        RuntimeError
+            If ``polars`` is not installed.
+        ValueError
+            If the file is an Excel or JSON file.
+        """
+        if pl is None:
+            raise RuntimeError("Lazy loading requires polars to be installed.")
+
+        self.file_type = self._detect_file_type()
+        if self.file_type == "parquet":
+            lf = pl.scan_parquet(self.file_path, low_memory=True)
+        elif self.file_type == "arrow":
+            lf = pl.scan_ipc(self.file_path)
+        elif self.file_type == "csv":
+            sep = "\t" if self.file_path.suffix.lower() == ".tsv" else ","
+            encoding = "utf8" if self._detect_encoding() == "utf-8" else "utf8-lossy"
+            lf = pl.scan_csv(
+                self.file_path,
+                separator=sep,
+                encoding=encoding,
+                infer_schema_length=10_000,
+                low_memory=True,
+            )
+        else:
+            raise ValueError(
+                f"Lazy loading supports CSV/TSV, Parquet and Feather files "
+                f"only, got '{self.file_path.suffix}'."
+            )
+        names = lf.collect_schema().names()
+        if _needs_normalization(names):
+            lf = lf.rename(dict(zip(names, _normalize_names(names))))
+        logger.info("Scanning %s file lazily with polars", self.file_type)
+        return lf
+
+    @property
+    def supports_lazy_scan(self) -> bool:
+        """Whether :meth:`load_lazy` can read this file.
+
+        Legacy Feather V1 files are not Arrow IPC files, which is all
+        ``pl.scan_ipc`` reads, so they are excluded.
+        """
+        if pl is None:
+            return False
+        file_type = self._detect_file_type()
+        if file_type == "arrow":
+            with open(self.file_path, "rb") as fh:
+                return fh.read(6) == b"ARROW1"
+        return file_type in ("csv", "parquet")
+
+    @property
+    def supports_arrow_streaming(self) -> bool:
+        """Whether :meth:`iter_arrow_batches` can read this file."""
+        return pa is not None and self._detect_file_type() in (
+            "csv", "parquet", "arrow",
+        )
+
+    def iter_arrow_batches(
+        self, block_size: int = _CSV_BLOCK_SIZE,
+    ) -> Iterator["pa.RecordBatch"]:
+        """Yield a CSV/TSV, Parquet or Feather file as Arrow record batches.
+
+        CSV batches come from ``pyarrow.csv.open_csv``; columnar files are
+        read from a memory map.  Batches carry normalized column names and
+        nothing is converted to pandas, so this is the cheapest way to feed
+        :meth:`SchemaProfiler.update`.  Peak memory is about one block
+        regardless of file size.  CSV column types are inferred from the
+        first block, as with any streaming Arrow reader.
+
+        Parameters
+        ----------
+        block_size : int, optional
+            Bytes of CSV text per batch (default 8 MiB).  Ignored for
+            columnar files, which are read in their stored batches.
+
+        Yields
+        ------
+        pa.RecordBatch
+            Consecutive record batches of roughly one block each.
+
+        Raises
+        ------
+        RuntimeError
+            If ``pyarrow`` is not installed.
+        ValueError
+            If the file is an Excel or JSON file, or a later CSV block holds
+            values that do not fit the column types inferred from the first.
+        """
+        if pacsv is None:
+            raise RuntimeError("Arrow streaming requires pyarrow to be installed.")
+
+        self.file_type = self._detect_file_type()
+        if self.file_type in ("parquet", "arrow"):
+            yield from self._iter_columnar_batches()
+            return
+        if self.file_type != "csv":
+            raise ValueError(
+                f"Arrow streaming supports CSV/TSV, Parquet and Feather files "
+                f"only, got '{self.file_path.suffix}'."
+            )
+
+        sep = "\t" if self.file_path.suffix.lower() == ".tsv" else ","
+        read_options = pacsv.ReadOptions(
+            encoding=self._detect_encoding(), block_size=block_size,
+        )
+        parse_options = pacsv.ParseOptions(delimiter=sep, newlines_in_values=True)
+        reader = pacsv.open_csv(
+            self.file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+        )
+
+        # Keep date-like text as strings, matching the in-memory loaders.
+        temporal = {
+            field.name: pa.string()
+            for field in reader.schema
+            if pa.types.is_temporal(field.type)
+        }
+        if temporal:
+            reader.close()
+            reader = pacsv.open_csv(
+                self.file_path,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=pacsv.ConvertOptions(
+                    strings_can_be_null=True, column_types=temporal,
+                ),
+            )
+
+        logger.info("Streaming CSV as Arrow record batches")
+        yield from _renamed_batches(
+            reader, reader.schema, self.file_path.name,
+            names=_dedup_names(reader.schema.names),
+        )
 
     # ------------------------------------------------------------------
     # File-type detection
@@ -127,7 +381,8 @@ class DatasetLoader:
         Returns
         -------
         str
-            One of ``"csv"``, ``"excel"``, ``"json"``.
+            One of ``"csv"``, ``"excel"``, ``"json"``, ``"parquet"``,
+            ``"arrow"``.
 
         Raises
         ------
@@ -146,6 +401,28 @@ class DatasetLoader:
 
         return file_type
 
+    def _detect_encoding(self) -> str:
+        """Return ``"utf-8"`` if the whole file decodes as UTF-8, else
+        ``"latin-1"``.
+
+        Used by the streaming readers, which cannot retry with another
+        encoding once chunks have been handed out.  The file is decoded in
+        1 MiB blocks, so memory stays constant regardless of file size.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            with open(self.file_path, "rb") as fh:
+                for block in iter(lambda: fh.read(1 << 20), b""):
+                    decoder.decode(block)
+                decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            logger.warning(
+                "Encoding 'utf-8' failed for %s, using latin-1.",
+                self.file_path.name,
+            )
+            return "latin-1"
+        return "utf-8"
+
     # ------------------------------------------------------------------
     # Format-specific readers
     # ------------------------------------------------------------------
@@ -155,9 +432,64 @@ class DatasetLoader:
 
         Tries UTF-8 first, then falls back to Latin-1 (ISO 8859-1) which
         can decode any byte sequence and covers most government data exports.
+        Uses the PyArrow reader when available, otherwise ``pd.read_csv``.
+        Files the PyArrow parser rejects (e.g. ragged rows) are handed to
+        ``pd.read_csv``, which either reads them or raises its own, more
+        specific parse error.
         """
         sep = "\t" if self.file_path.suffix.lower() == ".tsv" else ","
 
+        if pacsv is None:
+            return self._load_csv_pandas(sep)
+
+        for encoding in ("utf-8", "latin-1"):
+            try:
+                table = self._read_csv_table(sep, encoding)
+                # Keep date-like text as strings, matching pd.read_csv.
+                # Re-reading is the only way to get the original text back:
+                # casting a parsed timestamp to string reformats it.
+                temporal = {
+                    field.name: pa.string()
+                    for field in table.schema
+                    if pa.types.is_temporal(field.type)
+                }
+                if temporal:
+                    table = self._read_csv_table(sep, encoding, temporal)
+            except pa.ArrowInvalid as exc:
+                # A parse error, not a decoding one: another encoding would
+                # fail the same way.
+                logger.warning(
+                    "PyArrow could not parse %s (%s); retrying with pandas.",
+                    self.file_path.name,
+                    exc,
+                )
+                return self._load_csv_pandas(sep)
+
+            # Arrow does not raise on invalid UTF-8; it types the affected
+            # columns as binary instead.
+            if encoding == "utf-8" and any(
+                pa.types.is_binary(field.type) for field in table.schema
+            ):
+                logger.warning(
+                    "Encoding '%s' failed for %s, trying next...",
+                    encoding,
+                    self.file_path.name,
+                )
+                continue
+
+            table = table.rename_columns(_dedup_names(table.column_names))
+            logger.info("CSV loaded with encoding: %s", encoding)
+            return table.to_pandas(
+                split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype,
+            )
+
+        raise RuntimeError(
+            f"Failed to load CSV after trying all supported encodings: "
+            f"{self.file_path}"
+        )
+
+    def _load_csv_pandas(self, sep: str) -> pd.DataFrame:
+        """Load a CSV/TSV file with ``pd.read_csv`` (no PyArrow available)."""
         for encoding in ("utf-8", "latin-1"):
             try:
                 df = pd.read_csv(
@@ -180,13 +512,51 @@ class DatasetLoader:
             f"{self.file_path}"
         )
 
+    def _read_csv_table(
+        self,
+        sep: str,
+        encoding: str,
+        column_types: Optional[dict[str, "pa.DataType"]] = None,
+    ) -> "pa.Table":
+        """Read the whole CSV/TSV file with PyArrow's multi-threaded reader."""
+        return pacsv.read_csv(
+            self.file_path,
+            read_options=pacsv.ReadOptions(
+                encoding=encoding,
+                block_size=_CSV_BLOCK_SIZE,
+                use_threads=True,
+            ),
+            parse_options=pacsv.ParseOptions(
+                delimiter=sep, newlines_in_values=True,
+            ),
+            convert_options=pacsv.ConvertOptions(
+                strings_can_be_null=True, column_types=column_types,
+            ),
+        )
+
     def _load_excel(self) -> pd.DataFrame:
         """Load an Excel file (.xls or .xlsx).
 
-        Uses the default ``openpyxl`` engine for .xlsx and ``xlrd`` for .xls.
-        Only the first sheet is loaded; multi-sheet support can be added in
-        a future iteration.
+        Uses the Rust-based ``calamine`` engine when ``python-calamine`` is
+        installed, otherwise the default ``openpyxl`` engine for .xlsx and
+        ``xlrd`` for .xls, which is also tried when calamine fails to read
+        the workbook.  Only the first sheet is loaded; multi-sheet
+        support can be added in a future iteration.
         """
+        try:
+            df = pd.read_excel(self.file_path, sheet_name=0, engine="calamine")
+            logger.info("Excel file loaded successfully (calamine engine).")
+            return df
+        except (ImportError, ValueError) as exc:
+            # ImportError: python-calamine missing; ValueError: pandas < 2.2.
+            logger.debug("calamine engine unavailable (%s); using default.", exc)
+        except CalamineError as exc:
+            # Let the default engine retry; it raises RuntimeError if the
+            # workbook is unreadable there too.
+            logger.warning(
+                "calamine could not read %s (%s); retrying.", self.file_path.name, exc,
+            )
+
         try:
             df = pd.read_excel(self.file_path, sheet_name=0)
             logger.info("Excel file loaded successfully.")
@@ -196,12 +566,110 @@ class DatasetLoader:
                 f"Failed to load Excel file: {self.file_path}"
             ) from exc
 
+    def _read_arrow_table(self) -> "pa.Table":
+        """Read a Parquet or Feather / Arrow IPC file into an Arrow table.
+
+        The file is memory-mapped and, for Parquet, decoded on multiple
+        threads.  Uncompressed Feather columns stay backed by the mapping.
+        """
+        if pa is None:
+            raise RuntimeError(
+                f"Reading '{self.file_path.suffix}' files requires pyarrow."
+            )
+        try:
+            if self.file_type == "parquet":
+                import pyarrow.parquet as pq
+
+                return pq.read_table(
+                    self.file_path, memory_map=True, use_threads=True,
+                )
+            import pyarrow.feather as feather
+
+            return feather.read_table(self.file_path, memory_map=True)
+        except (pa.ArrowInvalid, OSError) as exc:
+            raise RuntimeError(f"Failed to read {self.file_path}: {exc}") from exc
+
+    def _load_columnar(self) -> pd.DataFrame:
+        """Load a Parquet or Feather file as Arrow-backed pandas columns.
+
+        The pandas metadata stored by ``DataFrame.to_parquet`` is ignored,
+        so a saved index comes back as an ordinary column — exactly what
+        :meth:`_iter_columnar_batches` yields — instead of being moved into
+        the frame's index and later dropped by ``to_csv(index=False)``.
+        """
+        table = self._read_arrow_table()
+        logger.info("%s file loaded successfully.", self.file_type.capitalize())
+        return table.to_pandas(
+            split_blocks=True,
+            self_destruct=True,
+            ignore_metadata=True,
+            types_mapper=pd.ArrowDtype,
+        )
+
+    def _iter_columnar_batches(
+        self, batch_size: int = _DEFAULT_CHUNKSIZE,
+    ) -> Iterator["pa.RecordBatch"]:
+        """Yield a Parquet or Feather file's record batches from a memory map.
+
+        Parquet is decoded ``batch_size`` rows at a time; Arrow IPC files
+        are yielded one stored batch at a time (legacy Feather V1 files
+        are read whole first).  Batches carry normalized column names.
+        """
+        if pa is None:
+            raise RuntimeError(
+                f"Reading '{self.file_path.suffix}' files requires pyarrow."
+            )
+        if self.file_type == "parquet":
+            import pyarrow.parquet as pq
+
+            source = pq.ParquetFile(self.file_path, memory_map=True)
+            schema = source.schema_arrow
+            batches = source.iter_batches(batch_size=batch_size)
+        else:
+            try:
+                reader = pa.ipc.open_file(pa.memory_map(str(self.file_path)))
+                schema = reader.schema
+                batches = (
+                    reader.get_batch(i) for i in range(reader.num_record_batches)
+                )
+            except pa.ArrowInvalid:
+                # Legacy Feather V1 is not an IPC file; read it whole.
+                table = self._read_arrow_table()
+                schema, batches = table.schema, iter(table.to_batches())
+
+        logger.info("Streaming %s file as Arrow record batches", self.file_type)
+        yield from _renamed_batches(batches, schema, self.file_path.name)
+
     def _load_json(self) -> pd.DataFrame:
         """Load a JSON file into a DataFrame.
 
         Expects either a JSON array of records or a JSON object whose values
-        are column arrays (pandas ``read_json`` auto-detects orientation).
+        are column arrays.  The file is parsed once into Python objects
+        (with ``orjson`` when installed) and handed to the DataFrame
+        constructor; ``pd.read_json`` is kept as a last resort for layouts
+        the constructor does not understand.
         """
+        raw = self.file_path.read_bytes()
+        loads = orjson.loads if orjson is not None else json.loads
+
+        for encoding in ("utf-8", "latin-1"):
+            try:
+                data = loads(raw if encoding == "utf-8" else raw.decode(encoding))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # orjson reports invalid UTF-8 as a JSONDecodeError.
+                logger.warning(
+                    "Encoding '%s' failed for %s, trying next...",
+                    encoding,
+                    self.file_path.name,
+                )
+                continue
+
+            df = self._json_to_frame(data)
+            if df is not None:
+                logger.info("JSON loaded with encoding: %s", encoding)
+                return df
+            break
+
         for encoding in ("utf-8", "latin-1"):
             try:
                 df = pd.read_json(self.file_path, encoding=encoding)
@@ -219,6 +687,19 @@ class DatasetLoader:
             f"{self.file_path}"
         )
 
+    @staticmethod
+    def _json_to_frame(data: Any) -> Optional[pd.DataFrame]:
+        """Build a DataFrame from parsed JSON, or return ``None`` if the
+        layout is not a list of records or a dict of columns."""
+        try:
+            if isinstance(data, list):
+                return pd.DataFrame.from_records(data)
+            if isinstance(data, dict):
+                return pd.DataFrame(data)
+        except (TypeError, ValueError):
+            pass
+        return None
+
     # ------------------------------------------------------------------
     # Column normalization
     # ------------------------------------------------------------------
@@ -243,12 +724,81 @@ class DatasetLoader:
         pd.DataFrame
             The same DataFrame with updated column names.
         """
-        import re
+        # Re-ingested or already-clean extracts need no rewrite.
+        if not _needs_normalization(df.columns):
+            return df
 
-        df.columns = [
-            re.sub(r"\s+", "_", str(col).strip().lower())
-            for col in df.columns
-        ]
+        df.columns = _normalize_names(df.columns)
 
-        logger.debug("Normalized columns: %s", list(df.columns))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Normalized columns: %s", list(df.columns))
         return df
+
+
+def _needs_normalization(names: Iterable[Any]) -> bool:
+    """Return True unless every name is already a normalized string."""
+    return not all(
+        isinstance(name, str)
+        and name == name.strip().lower()
+        and _WS_RE.search(name) is None
+        for name in names
+    )
+
+
+def _renamed_batches(
+    batches: Iterable["pa.RecordBatch"],
+    schema: "pa.Schema",
+    source_name: str,
+    names: Optional[list[str]] = None,
+) -> Iterator["pa.RecordBatch"]:
+    """Yield ``batches`` with normalized column names.
+
+    A file with a schema but no rows (e.g. a header-only CSV) produces no
+    batches at all; one empty batch built from ``schema`` is yielded
+    instead so consumers still see its columns and types.  ``ArrowInvalid``
+    raised while reading is re-raised as ``ValueError``.
+    """
+    names = list(_normalize_names(schema.names if names is None else names))
+    empty = True
+    try:
+        for batch in batches:
+            empty = False
+            yield pa.RecordBatch.from_arrays(batch.columns, names=names)
+    except pa.ArrowInvalid as exc:
+        raise ValueError(f"Cannot stream {source_name}: {exc}") from exc
+    if empty:
+        yield pa.RecordBatch.from_arrays(
+            [pa.nulls(0, field.type) for field in schema], names=names,
+        )
+
+
+def _dedup_names(names: Iterable[str]) -> list[str]:
+    """Rename repeated CSV headers the way ``pd.read_csv`` does.
+
+    The second ``x`` becomes ``x.1``, the third ``x.2``, skipping any
+    suffix that is itself a header in the file.  PyArrow keeps duplicate
+    headers as-is, which would leave the frame with ambiguous columns.
+    """
+    names = list(names)
+    header = set(names)
+    counts: dict[str, int] = {}
+    for i, name in enumerate(names):
+        base, count = name, counts.get(name, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in header else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def _normalize_names(names: Iterable[Any]) -> pd.Index:
+    """Apply the column-name normalization rules to *names*."""
+    return (
+        pd.Index(names)
+        .astype(str)
+        .str.strip()
+        .str.lower()
+        .str.replace(_WS_RE, "_", regex=True)
+    )
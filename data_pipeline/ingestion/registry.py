@@ -11,8 +11,21 @@ Architectural notes:
       This keeps the dependency footprint at zero and is adequate for the
       current scale.  If the number of registered datasets grows into the
       hundreds, migration to SQLite would be straightforward.
-    - Concurrency is NOT handled — this module assumes single-process
-      execution.  A file-lock wrapper can be added later if needed.
+    - Serialization uses ``orjson`` when it is installed and the stdlib
+      ``json`` module otherwise, so no extra dependency is required.
+    - ``register()`` appends one line to a ``registry.jsonl`` journal next
+      to the JSON file instead of rewriting the whole registry, so bulk
+      ingestion writes O(N) bytes rather than O(N²).  The indented
+      ``registry.json`` is rebuilt by :meth:`DatasetRegistry.flush` (also
+      called on context-manager exit), and any journal entries left behind
+      by an unflushed run are replayed on load.
+    - ``registry.json`` is replaced atomically (write-then-rename), so an
+      interrupted save leaves the previous version intact.
+    - Concurrency is limited to the journal: each registration is one
+      ``O_APPEND`` write, so several processes (``--manifest`` workers)
+      can register at once as long as only one of them calls ``flush()``.
+      Concurrent flushes are NOT handled; a file-lock wrapper can be
+      added later if needed.
     - The registry uses dataset *name* as the primary key.  Re-registering
       a name overwrites the previous entry (with a warning).  This allows
       re-ingestion of updated source files without manual cleanup.
@@ -22,14 +35,42 @@ Architectural notes:
 
 import json
 import logging
+import mmap
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
 from data_pipeline.config import REGISTRY_PATH
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed; use the stdlib json module
+
 logger = logging.getLogger(__name__)
 
+# Registry files larger than this are parsed straight from a memory map
+# (orjson only) instead of being read into a bytes object first.
+_MMAP_THRESHOLD: int = 1 << 20
+
+
+def _dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 
 class DatasetRegistry:
     """Persistent registry of ingested datasets.
@@ -46,6 +87,12 @@ class DatasetRegistry:
             profile=schema_profile_dict,
         )
         registry.list_datasets()
+        registry.flush()
+
+    or, to flush automatically::
+
+        with DatasetRegistry() as registry:
+            registry.register(...)
 
     Parameters
     ----------
@@ -55,8 +102,16 @@ class DatasetRegistry:
 
     def __init__(self, registry_path: Optional[Path] = None) -> None:
         self._path: Path = registry_path or REGISTRY_PATH
+        self._jsonl_path: Path = self._path.with_suffix(".jsonl")
+        self._pending: int = 0
         self._registry: dict[str, Any] = self._load_registry()
 
+    def __enter__(self) -> "DatasetRegistry":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -104,7 +159,7 @@ class DatasetRegistry:
             entry["transform_log_path"] = str(Path(transform_log_path).resolve())
 
         self._registry[dataset_name] = entry
-        self._save_registry()
+        self._append_journal(dataset_name, entry)
 
         logger.info(
             "Registered dataset '%s' — rows=%d, cols=%d",
@@ -113,6 +168,17 @@ class DatasetRegistry:
             entry["num_columns"],
         )
 
+    def flush(self) -> None:
+        """Rebuild the indented registry JSON and clear the journal.
+
+        A no-op when nothing has been registered since the last flush.
+        """
+        if not self._pending:
+            return
+        self._save_registry()
+        self._jsonl_path.unlink(missing_ok=True)
+        self._pending = 0
+
     def list_datasets(self) -> list[dict[str, Any]]:
         """Return a lightweight summary of all registered datasets.
 
@@ -162,31 +228,98 @@ class DatasetRegistry:
 
     def _load_registry(self) -> dict[str, Any]:
         """Load the registry from disk, or return an empty dict if the
-        file does not exist or is corrupt."""
-        if not self._path.exists():
+        file does not exist or is corrupt.  Unflushed journal entries are
+        replayed on top, overriding the JSON file on name collisions."""
+        data: dict[str, Any] = {}
+        if self._path.exists():
+            try:
+                data = self._read_registry_file()
+                logger.info("Loaded registry with %d dataset(s).", len(data))
+            except (json.JSONDecodeError, OSError) as exc:
+                logger.error(
+                    "Failed to load registry at %s: %s — starting fresh.",
+                    self._path,
+                    exc,
+                )
+                data = {}
+        elif not self._jsonl_path.exists():
             logger.info("No existing registry found — starting fresh.")
-            return {}
+            return data
+
+        self._pending = self._replay_journal(data)
+        if self._pending:
+            logger.info(
+                "Replayed %d unflushed registration(s) from %s",
+                self._pending,
+                self._jsonl_path,
+            )
+        return data
+
+    def _read_registry_file(self) -> Any:
+        """Parse the registry JSON file.
+
+        Large files are memory-mapped and handed to ``orjson`` as a buffer,
+        which saves one full userland copy of the file on startup.
+        """
+        if orjson is not None and self._path.stat().st_size > _MMAP_THRESHOLD:
+            with open(self._path, "rb") as fh, mmap.mmap(
+                fh.fileno(), 0, access=mmap.ACCESS_READ,
+            ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return _loads(self._path.read_bytes())
 
+    def _replay_journal(self, registry: dict[str, Any]) -> int:
+        """Apply journal entries to *registry* in order; return the count."""
+        if not self._jsonl_path.exists():
+            return 0
+
+        replayed = 0
         try:
-            with open(self._path, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
-                logger.info(
-                    "Loaded registry with %d dataset(s).", len(data)
-                )
-                return data
-        except (json.JSONDecodeError, OSError) as exc:
+            with open(self._jsonl_path, "rb") as fh:
+                for lineno, line in enumerate(fh, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = _loads(line)
+                    except json.JSONDecodeError:
+                        # A crash mid-append can leave a truncated last line.
+                        logger.warning(
+                            "Skipping corrupt line %d in %s",
+                            lineno,
+                            self._jsonl_path,
+                        )
+                        continue
+                    registry[record.pop("name")] = record
+                    replayed += 1
+        except OSError as exc:
             logger.error(
-                "Failed to load registry at %s: %s — starting fresh.",
-                self._path,
+                "Failed to read registry journal at %s: %s",
+                self._jsonl_path,
                 exc,
             )
-            return {}
+        return replayed
+
+    def _append_journal(self, dataset_name: str, entry: dict[str, Any]) -> None:
+        """Append a single registration to the JSONL journal."""
+        self._jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Unbuffered, so the whole line goes out in a single append write
+        # and lines from concurrent workers never interleave.
+        with open(self._jsonl_path, "ab", buffering=0) as fh:
+            fh.write(_dumps({"name": dataset_name, **entry}) + b"\n")
+        self._pending += 1
 
     def _save_registry(self) -> None:
-        """Persist the registry dict to disk as formatted JSON."""
+        """Persist the registry dict to disk as formatted JSON.
+
+        The JSON is written to a temporary file in the same directory and
+        then atomically renamed over the registry, so a crash mid-write
+        can never leave a truncated registry behind.
+        """
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self._path, "w", encoding="utf-8") as fh:
-            json.dump(self._registry, fh, indent=2, ensure_ascii=False)
+        tmp_path = self._path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_dumps(self._registry, indent=True))
+        os.replace(tmp_path, self._path)
 
         logger.info("Registry saved to %s", self._path)
@@ -8,19 +8,91 @@ detection of temporal and geographic columns.
 
 Architectural notes:
     - Detection heuristics for time and geography columns are intentionally
-      shallow — they match on column *names* only (not values).  This avoids
-      false positives from value-sniffing and keeps the profiler fast.
+      shallow — they match on column *names*.  The one value-based addition
+      is for dates stored as text: a format is guessed from a column's first
+      non-null value and checked against its first 50 values, so a column
+      that is not a date costs O(50), never a full ``pd.to_datetime``.
+      With pyarrow installed the check is a single ``pc.strptime`` call.
     - The profile is returned as a plain ``dict`` so it can be serialized
       to JSON without custom encoders.  Numpy dtypes are cast to strings
       for the same reason.
-    - This module does NOT attempt semantic inference, type coercion, or
-      any data modification.  It is strictly read-only.
+    - This module does NOT attempt type coercion or any data modification.
+      It is strictly read-only.
+    - Profiling is incremental: :meth:`SchemaProfiler.update` folds one
+      chunk of rows into running counters, so a file can be profiled chunk
+      by chunk without ever being fully resident in memory.
+      :meth:`SchemaProfiler.from_arrow_stream` does the same directly on
+      Arrow record batches, reading null counts from Arrow's metadata.
+      :meth:`SchemaProfiler.from_lazy_frame` instead pushes every aggregate
+      into one Polars query over a lazily scanned file.
+    - Numeric columns are summarized (min / max / mean / std) by one
+      kernel call per chunk in :mod:`._stats_numba`, compiled with Numba
+      when it is installed, instead of a pandas reduction per column per
+      statistic.  An ahead-of-time build of the kernel (``_stats_aot``) is
+      preferred when present so one-shot CLI runs skip the JIT compile and
+      never import numba; small blocks use the numpy version in
+      :mod:`._stats_numpy`.
+      Each chunk yields a mean and sum of squared deviations, merged with
+      Chan's formula, so ``std`` stays exact for large-valued columns.
+    - Distinct counts are estimated with a per-column HyperLogLog sketch
+      (:mod:`._hll`), so cardinality costs fixed memory however many
+      chunks are streamed through.
+    - Per-column work (null masks, sketch updates) is independent, so on
+      wide, large chunks it runs on a ``joblib`` thread pool when joblib is
+      installed.  The work is numpy-vectorized and mostly releases the
+      GIL; without joblib, columns are processed serially.
+    - Text columns are tagged with a semantic type (email, URL, IP
+      address, phone, ZIP code) when at least 90 % of their first 1,000
+      non-null values match its pattern.  Matching uses Hyperscan when it
+      is installed (:mod:`._semantic`).
+    - Value-level statistics are computed on at most ``sample_rows`` rows
+      (a seeded random sample of an in-memory frame, or the leading rows
+      of a chunk stream).  ``num_rows`` is always the full count.  A
+      column that is entirely null in the sample is reported with dtype
+      ``"unknown"`` rather than guessed.
 """
 
 import logging
-from typing import Any
+import math
+import warnings
+from dataclasses import dataclass
+from sys import intern
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import pandas_dtype
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+from data_pipeline.config import DEFAULT_PROFILE_SAMPLE_ROWS
+from data_pipeline.ingestion._hll import HyperLogLog
+from data_pipeline.ingestion._semantic import SEMANTIC_TYPES, count_semantic_matches
+from data_pipeline.ingestion._stats_numpy import col_moments_numpy
+
+try:
+    # Pre-built by ``python -m data_pipeline.ingestion._stats_aot_build``;
+    # importing it does not load numba.
+    from data_pipeline.ingestion._stats_aot import col_moments
+except ImportError:
+    from data_pipeline.ingestion._stats_numba import col_moments
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = delayed = None  # joblib not installed; columns run serially
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None  # pyarrow not installed; dates are checked with pandas
+
+if TYPE_CHECKING:
+    import polars as pl
 
 logger = logging.getLogger(__name__)
 
@@ -29,24 +101,88 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 # Keywords that suggest a column contains temporal information.
-_TIME_KEYWORDS: set[str] = {
+_TIME_KEYWORDS: frozenset[str] = frozenset({
     "date", "year", "month", "day", "quarter", "time",
     "timestamp", "fiscal_year", "fy", "tax_year", "period",
     "tax_period", "tax_prd",
-}
+})
 
 # Keywords that suggest a column contains geographic information.
-_GEO_KEYWORDS: set[str] = {
+_GEO_KEYWORDS: frozenset[str] = frozenset({
     "state", "fips", "county", "zip", "zipcode", "zip_code",
     "city", "region", "country", "province", "territory",
     "state_cd", "state_code", "st",
-}
+})
 
 # Keywords that suggest a column is an identifier (key, not a metric).
-_ID_KEYWORDS: set[str] = {
+_ID_KEYWORDS: frozenset[str] = frozenset({
     "id", "ein", "code", "key", "name", "desc", "description",
     "type", "category", "status", "ntee", "naics", "sic",
-}
+})
+
+
+# Below this many rows per chunk numpy reductions are already cheap and not
+# worth the Numba dispatch (or first-call compile) overhead.
+_KERNEL_MIN_ROWS: int = 100_000
+
+# Per-column work is spread over a thread pool only for chunks at least
+# this wide and this large; below that, pool start-up costs more than it
+# saves.
+_PARALLEL_MIN_COLUMNS: int = 8
+_PARALLEL_MIN_CELLS: int = 1_000_000
+
+# Non-null values per text column checked against the semantic patterns,
+# and the share of them that must match for a type to be assigned.
+_SEMANTIC_SAMPLE_VALUES: int = 1_000
+_SEMANTIC_MIN_SHARE: float = 0.9
+
+# Leading non-null values kept per column for value-based detectors.
+_FIRST_VALUES: int = 50
+
+# Share of a text column's leading values that must parse with the guessed
+# format for the column to count as a date column.
+_DATETIME_MIN_SHARE: float = 0.9
+
+# Seed for the row sample, so re-profiling the same file is reproducible.
+_SAMPLE_SEED: int = 0
+
+
+@dataclass(slots=True)
+class ColumnSummary:
+    """Per-column facts computed once and shared by every detector.
+
+    Attributes
+    ----------
+    name : str
+        Column name.
+    tokens : frozenset[str]
+        Lowercased name split on underscores, for keyword matching.
+    dtype : str
+        Resolved dtype string (as reported in the profile).
+    dtype_kind : str
+        NumPy-style kind character of ``dtype`` (``"i"``, ``"f"``, ``"O"``
+        …), or ``""`` when the dtype is ``"unknown"``.
+    n_null : int
+        Missing values among the profiled rows.
+    n_unique_estimate : int or None
+        Approximate distinct non-null values, if any values were seen.
+    first_values : list[str]
+        Up to ``_FIRST_VALUES`` leading non-null values, as strings.
+    semantic_checked : int
+        Values checked against the semantic patterns (text columns only).
+    semantic_hits : dict[str, int]
+        Semantic type → number of checked values that matched it.
+    """
+
+    name: str
+    tokens: frozenset[str]
+    dtype: str
+    dtype_kind: str
+    n_null: int
+    n_unique_estimate: Optional[int]
+    first_values: list[str]
+    semantic_checked: int
+    semantic_hits: dict[str, int]
 
 
 class SchemaProfiler:
@@ -57,8 +193,13 @@ class SchemaProfiler:
     - ``columns``       : list of column names
     - ``dtypes``        : mapping of column name → dtype string
     - ``num_rows``      : total row count
+    - ``profiled_rows`` : rows actually inspected (≤ ``num_rows``)
     - ``num_columns``   : total column count
     - ``missingness``   : mapping of column name → percent missing (0–100)
+    - ``numeric_stats`` : mapping of numeric column → ``min``/``max``/``mean``/``std``
+    - ``n_unique``      : mapping of column name → approximate distinct count
+    - ``semantic_types``: mapping of text column → detected semantic type
+    - ``datetime_formats``: mapping of text date column → ``strftime`` format
     - ``time_columns``  : columns likely containing temporal data
     - ``geo_columns``   : columns likely containing geographic data
 
@@ -67,41 +208,292 @@ class SchemaProfiler:
         profiler = SchemaProfiler(df)
         profile = profiler.generate_profile()
 
+        # Or, for files larger than memory (DataFrame chunks or Arrow
+        # record batches):
+        profiler = SchemaProfiler()
+        for batch in DatasetLoader(path).iter_arrow_batches():
+            profiler.update(batch)
+        profile = profiler.finalize()
+
     Parameters
     ----------
-    df : pd.DataFrame
+    df : pd.DataFrame, optional
         The DataFrame to profile (typically from :class:`DatasetLoader`).
+        If omitted, feed rows in with :meth:`update` instead.
+    sample_rows : int or None, optional
+        Maximum number of rows to inspect for dtypes and missingness
+        (default :data:`DEFAULT_PROFILE_SAMPLE_ROWS`).  ``None`` profiles
+        every row.
     """
 
-    def __init__(self, df: pd.DataFrame) -> None:
-        if df.empty:
-            logger.warning("Profiling an empty DataFrame.")
-        self._df: pd.DataFrame = df
+    def __init__(
+        self,
+        df: Optional[pd.DataFrame] = None,
+        *,
+        sample_rows: Optional[int] = DEFAULT_PROFILE_SAMPLE_ROWS,
+    ) -> None:
+        if sample_rows is not None and sample_rows < 1:
+            raise ValueError(f"sample_rows must be positive, got {sample_rows}")
+
+        self._sample_rows = sample_rows
+        self._columns: list[str] = []
+        self._dtypes: dict[str, str] = {}
+        self._null_counts: dict[str, int] = {}
+        self._row_count: int = 0
+        self._profiled_rows: int = 0
+        # Running [min, max, mean, M2 (sum of squared deviations), non-null
+        # count] per numeric column, merged across chunks with Chan's formula.
+        self._numeric: dict[str, list[float]] = {}
+        # None marks a column whose values could not be hashed at all.
+        self._sketches: dict[str, Optional[HyperLogLog]] = {}
+        # Per text column: values checked so far and matches per type.
+        self._semantic_seen: dict[str, int] = {}
+        self._semantic_hits: dict[str, dict[str, int]] = {}
+        self._first_values: dict[str, list[str]] = {}
+        # Distinct counts supplied by an external engine (see from_lazy_frame)
+        # for columns that have no sketch.
+        self._distinct_counts: dict[str, int] = {}
+        self._arrow_dtypes: Optional[list[str]] = None
+        self._profile: Optional[dict[str, Any]] = None
+
+        if df is not None:
+            self.update(df)
+
+    @classmethod
+    def from_arrow_stream(
+        cls,
+        batches: Iterable["pa.RecordBatch"],
+        *,
+        sample_rows: Optional[int] = DEFAULT_PROFILE_SAMPLE_ROWS,
+    ) -> "SchemaProfiler":
+        """Build a profiler from a stream of Arrow record batches.
+
+        Nothing is converted to pandas: null counts come straight from each
+        batch's column metadata, numeric statistics from Arrow kernels, and
+        only each batch's distinct values are materialized for the
+        cardinality sketch.  Peak memory is one batch.  As with a
+        DataFrame stream, only the leading ``sample_rows`` rows are
+        profiled; later batches just add to the row count.
+
+        Parameters
+        ----------
+        batches : iterable of pa.RecordBatch
+            Typically :meth:`DatasetLoader.iter_arrow_batches`.
+        sample_rows : int or None, optional
+            Maximum number of rows to profile; ``None`` profiles every row.
+
+        Returns
+        -------
+        SchemaProfiler
+            A profiler ready for :meth:`generate_profile`.
+        """
+        profiler = cls(sample_rows=sample_rows)
+        for batch in batches:
+            profiler.update(batch)
+        return profiler
+
+    @classmethod
+    def from_lazy_frame(
+        cls,
+        lf: "pl.LazyFrame",
+        *,
+        sample_rows: Optional[int] = DEFAULT_PROFILE_SAMPLE_ROWS,
+    ) -> "SchemaProfiler":
+        """Build a profiler from a Polars ``LazyFrame`` in one query.
+
+        Every per-column aggregate (null count, distinct count, numeric
+        min / max / mean / variance, leading text values) is expressed
+        as one ``select`` over the leading ``sample_rows`` rows and
+        collected with the streaming engine, so Polars fuses them into a
+        single pass over the source.  When sampling, the full row count is
+        collected alongside it.  Distinct counts come from Polars' own
+        ``approx_n_unique``; dtypes are reported as ``[pyarrow]`` pandas
+        names, as by the other paths.
+
+        Parameters
+        ----------
+        lf : pl.LazyFrame
+            Typically :meth:`DatasetLoader.load_lazy`.
+        sample_rows : int or None, optional
+            Maximum number of rows to profile; ``None`` profiles every row.
+
+        Returns
+        -------
+        SchemaProfiler
+            A profiler ready for :meth:`generate_profile`.
+        """
+        import polars as pl
+
+        profiler = cls(sample_rows=sample_rows)
+        schema = lf.collect_schema()
+        names = schema.names()
+        aggs = [pl.len().alias("__rows")]
+        for i, (name, dtype) in enumerate(schema.items()):
+            col = pl.col(name)
+            aggs.append(col.null_count().alias(f"{i}__null"))
+            aggs.append(col.drop_nulls().approx_n_unique().alias(f"{i}__uniq"))
+            if dtype.is_numeric():
+                values = col.cast(pl.Float64)
+                aggs += [
+                    values.min().alias(f"{i}__min"),
+                    values.max().alias(f"{i}__max"),
+                    values.mean().alias(f"{i}__mean"),
+                    values.var(ddof=0).alias(f"{i}__var"),
+                ]
+            n_head = _SEMANTIC_SAMPLE_VALUES if dtype == pl.String else _FIRST_VALUES
+            aggs.append(
+                col.drop_nulls().head(n_head).cast(pl.String).implode()
+                .alias(f"{i}__head")
+            )
+
+        if sample_rows is None:
+            queries = [lf.select(aggs)]
+        else:
+            queries = [lf.head(sample_rows).select(aggs), lf.select(pl.len())]
+        try:
+            results = pl.collect_all(queries, engine="streaming")
+        except TypeError:  # polars < 1.23
+            results = pl.collect_all(queries, streaming=True)
+        row = results[0].row(0, named=True)
+
+        n_rows = row["__rows"]
+        profiler._columns = [intern(name) for name in names]
+        profiler._profiled_rows = n_rows
+        profiler._row_count = results[-1].item(0, 0)
+        for i, (name, dtype) in enumerate(schema.items()):
+            n_null = row[f"{i}__null"]
+            profiler._dtypes[name] = intern(_polars_dtype_name(dtype))
+            profiler._null_counts[name] = n_null
+            profiler._distinct_counts[name] = row[f"{i}__uniq"]
+            if dtype.is_numeric():
+                lo, hi = row[f"{i}__min"], row[f"{i}__max"]
+                n_valid = n_rows - n_null
+                profiler._numeric[name] = [
+                    math.nan if lo is None else lo,
+                    math.nan if hi is None else hi,
+                    row[f"{i}__mean"] or 0.0,
+                    (row[f"{i}__var"] or 0.0) * n_valid,
+                    n_valid,
+                ]
+            profiler._observe_sample(
+                name, row[f"{i}__head"], is_text=dtype == pl.String,
+            )
+        return profiler
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def update(self, df_chunk: "pd.DataFrame | pa.RecordBatch") -> None:
+        """Fold one chunk of rows into the running profile.
+
+        Chunks must share the same columns (as produced by
+        :meth:`DatasetLoader.iter_chunks` or
+        :meth:`DatasetLoader.iter_arrow_batches`).  Once ``sample_rows``
+        rows of a stream have been inspected, further chunks only add to
+        the row count.
+
+        Parameters
+        ----------
+        df_chunk : pd.DataFrame or pa.RecordBatch
+            The next block of rows.
+        """
+        if not isinstance(df_chunk, pd.DataFrame):
+            self._update_arrow(df_chunk)
+            return
+
+        if not self._columns:
+            self._columns = [intern(col) for col in df_chunk.columns]
+
+        n_rows = len(df_chunk)
+        self._row_count += n_rows
+        self._profile = None
+
+        sample = self._take_sample(df_chunk)
+        if sample is None:
+            return
+        stats = self._scan_numeric(sample)
+        known = {col: len(sample) - s[4] for col, s in stats.items()}
+        tasks = [
+            (col, series, known.get(col)) for col, series in sample.items()
+        ]
+        if (
+            Parallel is not None
+            and len(tasks) >= _PARALLEL_MIN_COLUMNS
+            and sample.size >= _PARALLEL_MIN_CELLS
+            and sample.columns.is_unique
+        ):
+            counts = Parallel(n_jobs=-1, prefer="threads")(
+                delayed(self._profile_column)(*task) for task in tasks
+            )
+        else:
+            counts = [self._profile_column(*task) for task in tasks]
+        null_counts = {task[0]: n_null for task, n_null in zip(tasks, counts)}
+
+        self._merge_dtypes(self._extract_dtypes(sample), null_counts, len(sample))
+        self._merge_numeric_stats(stats)
+        self._accumulate_nulls(null_counts, len(sample))
+
+    def finalize(self) -> dict[str, Any]:
+        """Return the profile once every chunk has been fed to :meth:`update`.
+
+        Equivalent to :meth:`generate_profile`; reads naturally at the end
+        of a streaming loop.
+        """
+        return self.generate_profile()
+
     def generate_profile(self) -> dict[str, Any]:
         """Generate the full schema profile.
 
+        The result is memoized until the next :meth:`update`, so repeated
+        calls (e.g. re-registration) return the same dict without
+        recomputing anything.
+
         Returns
         -------
         dict
             A JSON-serializable dictionary containing all profile fields.
         """
-        time_cols = self._detect_time_columns()
-        geo_cols = self._detect_geo_columns()
+        if self._profile is not None:
+            return self._profile
+
+        rows, cols = self._row_count, len(self._columns)
+        if rows == 0:
+            logger.warning("Profiling an empty DataFrame.")
+        elif self._profiled_rows < rows:
+            logger.info(
+                "Profiled a sample of %d of %d rows", self._profiled_rows, rows,
+            )
+
+        summaries = self._summarize_columns()
+        time_cols, geo_cols = self._detect_keyword_columns(summaries)
+        datetime_formats = self._detect_datetime_formats(summaries)
+        if datetime_formats:
+            time_set = set(time_cols) | datetime_formats.keys()
+            time_cols = [s.name for s in summaries if s.name in time_set]
 
         profile: dict[str, Any] = {
             "columns": self._extract_columns(),
-            "dtypes": self._extract_dtypes(),
-            "num_rows": self._count_rows(),
-            "num_columns": self._count_columns(),
-            "missingness": self._compute_missingness(),
+            "dtypes": {summary.name: summary.dtype for summary in summaries},
+            "num_rows": rows,
+            "profiled_rows": self._profiled_rows,
+            "num_columns": cols,
+            "missingness": self._compute_missingness(
+                summaries, self._profiled_rows,
+            ),
+            "numeric_stats": self._compute_numeric_stats(),
+            "n_unique": {
+                summary.name: summary.n_unique_estimate
+                for summary in summaries
+                if summary.n_unique_estimate is not None
+            },
+            "semantic_types": self._detect_semantic_types(summaries),
+            "datetime_formats": datetime_formats,
             "time_columns": time_cols,
             "geo_columns": geo_cols,
-            "column_roles": self._detect_column_roles(time_cols, geo_cols),
+            "column_roles": self._detect_column_roles(
+                summaries, time_cols, geo_cols,
+            ),
         }
 
         roles = profile["column_roles"]
@@ -110,14 +502,15 @@ class SchemaProfiler:
         logger.info(
             "Profile generated — rows=%d, cols=%d, time=%d, geo=%d, "
             "keys=%d, metrics=%d",
-            profile["num_rows"],
-            profile["num_columns"],
+            rows,
+            cols,
             len(time_cols),
             len(geo_cols),
             n_keys,
             n_metrics,
         )
 
+        self._profile = profile
         return profile
 
     # ------------------------------------------------------------------
@@ -126,26 +519,348 @@ class SchemaProfiler:
 
     def _extract_columns(self) -> list[str]:
         """Return the list of column names."""
-        return list(self._df.columns)
+        return list(self._columns)
+
+    def _summarize_columns(self) -> list[ColumnSummary]:
+        """Build one :class:`ColumnSummary` per column from the running state.
+
+        Names are tokenized in one vectorized call and each sketch is
+        estimated once, so no detector has to recompute either.
+        """
+        dtypes = self._resolve_dtypes()
+        tokens = pd.Index(self._columns, dtype=object).str.lower().str.split("_")
+        summaries: list[ColumnSummary] = []
+        for col, toks in zip(self._columns, tokens):
+            dtype_str = dtypes.get(col, "unknown")
+            sketch = self._sketches.get(col)
+            summaries.append(ColumnSummary(
+                name=col,
+                tokens=frozenset(toks),
+                dtype=dtype_str,
+                dtype_kind=_dtype_kind(dtype_str),
+                n_null=self._null_counts.get(col, 0),
+                n_unique_estimate=(
+                    self._distinct_counts.get(col)
+                    if sketch is None else sketch.estimate()
+                ),
+                first_values=self._first_values.get(col, []),
+                semantic_checked=self._semantic_seen.get(col, 0),
+                semantic_hits=self._semantic_hits.get(col, {}),
+            ))
+        return summaries
+
+    def _take_sample(self, df_chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Return the rows of ``df_chunk`` that still fit the sample budget.
+
+        The whole chunk is returned while under budget.  A chunk that would
+        overflow it contributes a seeded random sample of the remaining
+        budget, so a single in-memory frame is sampled uniformly.  Returns
+        ``None`` once the budget is spent.
+        """
+        if self._sample_rows is None:
+            budget = len(df_chunk)
+        else:
+            budget = self._sample_rows - self._profiled_rows
+        if budget <= 0:
+            return None
+        if len(df_chunk) > budget:
+            return df_chunk.sample(n=budget, random_state=_SAMPLE_SEED)
+        return df_chunk
 
-    def _extract_dtypes(self) -> dict[str, str]:
+    def _resolve_dtypes(self) -> dict[str, str]:
+        """Return the dtype mapping, marking inconclusive columns.
+
+        When only a sample was inspected, a column that was entirely null
+        in it may still hold values elsewhere, so its dtype is reported as
+        ``"unknown"`` instead of the placeholder pandas assigned.
+        """
+        if self._profiled_rows >= self._row_count:
+            return dict(self._dtypes)
+        return {
+            col: (
+                "unknown"
+                if self._null_counts.get(col, 0) >= self._profiled_rows
+                else dtype_str
+            )
+            for col, dtype_str in self._dtypes.items()
+        }
+
+    @staticmethod
+    def _extract_dtypes(df_chunk: pd.DataFrame) -> dict[str, str]:
         """Return a mapping of column name to dtype as a string.
 
-        Numpy dtype objects are not JSON-serializable, so we cast to ``str``.
+        Numpy dtype objects are not JSON-serializable, so we keep each
+        dtype's ``name`` (identical to ``str(dtype)`` for numpy and pandas
+        extension dtypes), falling back to ``str`` for dtypes without one.
+        Names are interned: a handful of dtype strings repeat across every
+        column of every profile held in the registry.
+        """
+        return {
+            intern(col): intern(getattr(t, "name", None) or str(t))
+            for col, t in zip(df_chunk.columns.tolist(), df_chunk.dtypes.values)
+        }
+
+    def _merge_dtypes(
+        self, dtypes: dict[str, str], null_counts: dict[str, int], n_rows: int,
+    ) -> None:
+        """Merge a chunk's column dtypes into the running dtype mapping.
+
+        The first chunk fixes each column's dtype; later chunks can only
+        promote it (e.g. ``int64`` → ``float64`` once NaNs appear).  A chunk
+        in which a column is entirely null carries no type information and
+        is ignored for that column.
         """
-        return {col: str(dtype) for col, dtype in self._df.dtypes.items()}
+        for col, dtype_str in dtypes.items():
+            current = self._dtypes.get(col)
+            if current is None:
+                self._dtypes[col] = dtype_str
+            elif current != dtype_str and null_counts.get(col, 0) < n_rows:
+                self._dtypes[col] = _promote_dtype(current, dtype_str)
 
-    def _count_rows(self) -> int:
-        """Return the number of rows in the DataFrame."""
-        return len(self._df)
+    def _accumulate_nulls(self, null_counts: dict[str, int], n_rows: int) -> None:
+        """Add a chunk's null counts and row count to the profiled totals."""
+        for col, n_null in null_counts.items():
+            self._null_counts[col] = self._null_counts.get(col, 0) + n_null
+        self._profiled_rows += n_rows
 
-    def _count_columns(self) -> int:
-        """Return the number of columns in the DataFrame."""
-        return len(self._df.columns)
+    def _update_arrow(self, batch: "pa.RecordBatch") -> None:
+        """Fold one Arrow record batch into the running profile.
 
-    def _compute_missingness(self) -> dict[str, float]:
+        Dtypes are reported as the ``pd.ArrowDtype`` each Arrow type maps
+        to, matching the Arrow-backed frames :class:`DatasetLoader` returns,
+        so streamed and in-memory profiles agree.  Numeric statistics come
+        from Arrow's own compute kernels (``min_max``, ``mean``,
+        ``variance``) on values cast to ``float64``.  Non-numeric columns
+        are reduced to their distinct values with ``pc.unique`` before
+        hashing, so a repetitive text column costs one Python object per
+        distinct value rather than per row; only the few leading values
+        :meth:`_observe_sample` still needs are converted in full.
+        """
+        if self._arrow_dtypes is None:
+            self._columns = [intern(name) for name in batch.schema.names]
+            self._arrow_dtypes = [
+                intern(pd.ArrowDtype(field.type).name) for field in batch.schema
+            ]
+        self._row_count += batch.num_rows
+        self._profile = None
+
+        # Streams are sampled by their leading rows, as in _take_sample.
+        if self._sample_rows is not None:
+            budget = self._sample_rows - self._profiled_rows
+            if budget <= 0:
+                return
+            if batch.num_rows > budget:
+                batch = batch.slice(0, budget)
+
+        null_counts: dict[str, int] = {
+            name: column.null_count
+            for name, column in zip(batch.schema.names, batch.columns)
+        }
+        dtypes = dict(zip(batch.schema.names, self._arrow_dtypes))
+
+        stats: dict[str, tuple[float, float, float, float, int]] = {}
+        for name, column in zip(batch.schema.names, batch.columns):
+            if pd.ArrowDtype(column.type).kind not in "iuf":
+                continue
+            values = pc.cast(column, pa.float64())
+            extrema = pc.min_max(values).as_py()
+            n_valid = len(column) - column.null_count
+            stats[name] = (
+                math.nan if extrema["min"] is None else extrema["min"],
+                math.nan if extrema["max"] is None else extrema["max"],
+                pc.mean(values).as_py() or 0.0,
+                (pc.variance(values, ddof=0).as_py() or 0.0) * n_valid,
+                n_valid,
+            )
+
+        self._merge_dtypes(dtypes, null_counts, batch.num_rows)
+        self._merge_numeric_stats(stats)
+        for name, column in zip(batch.schema.names, batch.columns):
+            is_text = pa.types.is_string(column.type) or pa.types.is_large_string(
+                column.type
+            )
+            if pa.types.is_nested(column.type):
+                # pc.unique has no kernel for list / struct / map values;
+                # hash their Python text form instead.
+                self._update_sketch(name, np.array(
+                    [repr(v) for v in column.drop_null().to_pylist()],
+                    dtype=object,
+                ))
+            else:
+                # Numeric values convert to numpy without copying and hash
+                # faster than pc.unique can deduplicate them.
+                distinct = column if name in stats else pc.unique(column)
+                self._update_sketch(
+                    name, distinct.drop_null().to_numpy(zero_copy_only=False),
+                )
+
+            needed = _FIRST_VALUES - len(self._first_values.get(name, ()))
+            if is_text:
+                needed = max(
+                    needed, _SEMANTIC_SAMPLE_VALUES - self._semantic_seen.get(name, 0),
+                )
+            if needed > 0:
+                head = column.drop_null().slice(0, needed)
+                self._observe_sample(
+                    name, head.to_numpy(zero_copy_only=False), is_text=is_text,
+                )
+        self._accumulate_nulls(null_counts, batch.num_rows)
+
+    @staticmethod
+    def _scan_numeric(
+        df_chunk: pd.DataFrame,
+    ) -> dict[str, tuple[float, float, float, float, int]]:
+        """Return ``(min, max, mean, M2, non-null count)`` per numeric
+        column, where ``M2`` is the sum of squared deviations from the mean.
+
+        Every numeric column (numpy, nullable or Arrow-backed) is copied
+        once into a ``(n_columns, n_rows)`` float64 block and reduced by a
+        single :func:`col_moments` call.  Frames with duplicate column names
+        are skipped, since their columns cannot be addressed by name.
+        """
+        n_rows = len(df_chunk)
+        num_cols = [
+            col for col, dtype in df_chunk.dtypes.items() if dtype.kind in "iuf"
+        ]
+        if not num_cols or n_rows == 0 or not df_chunk.columns.is_unique:
+            return {}
+
+        block = np.empty((len(num_cols), n_rows), dtype=np.float64)
+        for k, col in enumerate(num_cols):
+            block[k] = df_chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        out_min = np.empty(len(num_cols))
+        out_max = np.empty(len(num_cols))
+        out_mean = np.empty(len(num_cols))
+        out_m2 = np.empty(len(num_cols))
+        out_nulls = np.empty(len(num_cols), dtype=np.int64)
+        kernel = (
+            col_moments
+            if col_moments is not None and n_rows >= _KERNEL_MIN_ROWS
+            else col_moments_numpy
+        )
+        kernel(block, out_min, out_max, out_mean, out_m2, out_nulls)
+
+        return {
+            col: (lo, hi, mean, m2, n_rows - n_null)
+            for col, lo, hi, mean, m2, n_null in zip(
+                num_cols, out_min.tolist(), out_max.tolist(),
+                out_mean.tolist(), out_m2.tolist(), out_nulls.tolist(),
+            )
+        }
+
+    def _merge_numeric_stats(
+        self, stats: dict[str, tuple[float, float, float, float, int]],
+    ) -> None:
+        """Fold one chunk's numeric statistics into the running totals.
+
+        Means and M2 are combined with Chan et al.'s pairwise update, which
+        stays accurate however large the values are relative to their
+        spread.
+        """
+        for col, (lo, hi, mean, m2, n_valid) in stats.items():
+            current = self._numeric.get(col)
+            if current is None:
+                self._numeric[col] = [lo, hi, mean, m2, n_valid]
+                continue
+            current[0] = float(np.fmin(current[0], lo))
+            current[1] = float(np.fmax(current[1], hi))
+            n_total = current[4] + n_valid
+            if n_valid and n_total:
+                delta = mean - current[2]
+                current[2] += delta * n_valid / n_total
+                current[3] += m2 + delta * delta * current[4] * n_valid / n_total
+            current[4] = n_total
+
+    def _observe_values(self, col: str, values: np.ndarray, *, is_text: bool) -> None:
+        """Feed one column's non-null values to its value-level trackers.
+
+        Every column updates its distinct-count sketch, then the leading
+        values go to :meth:`_observe_sample`.  Only ``col``'s own state is
+        touched, so columns may be observed from different threads.
+        """
+        self._update_sketch(col, values)
+        self._observe_sample(col, values, is_text=is_text)
+
+    def _update_sketch(self, col: str, values: np.ndarray) -> None:
+        """Add non-null values to ``col``'s distinct-count sketch.
+
+        A column whose values cannot be hashed loses its sketch, and so its
+        ``n_unique`` entry, with a warning; the rest of the profile is
+        unaffected.
+        """
+        if col in self._sketches and self._sketches[col] is None:
+            return
+        sketch = self._sketches.get(col)
+        if sketch is None:
+            sketch = self._sketches[col] = HyperLogLog()
+        try:
+            sketch.update(values)
+        except (TypeError, ValueError) as exc:
+            logger.warning(
+                "Cannot hash values of column '%s' (%s); skipping n_unique.",
+                col,
+                exc,
+            )
+            self._sketches[col] = None
+
+    def _observe_sample(self, col: str, values: Any, *, is_text: bool) -> None:
+        """Keep a column's first values and check text against the patterns.
+
+        The first ``_FIRST_VALUES`` values are kept for every column; text
+        columns are also checked against the semantic patterns until
+        ``_SEMANTIC_SAMPLE_VALUES`` of their values have been seen.
+        """
+        first = self._first_values.setdefault(col, [])
+        if len(first) < _FIRST_VALUES:
+            first.extend(str(v) for v in values[:_FIRST_VALUES - len(first)])
+
+        if not is_text:
+            return
+        seen = self._semantic_seen.get(col, 0)
+        remaining = _SEMANTIC_SAMPLE_VALUES - seen
+        if remaining <= 0:
+            return
+        batch = [str(v) for v in values[:remaining]]
+        hits = self._semantic_hits.setdefault(col, dict.fromkeys(SEMANTIC_TYPES, 0))
+        for sem_type, n_hits in count_semantic_matches(batch).items():
+            hits[sem_type] += n_hits
+        self._semantic_seen[col] = seen + len(batch)
+
+    def _profile_column(self, col: str, series: pd.Series, n_null: Optional[int]) -> int:
+        """Run the per-column work for one chunk and return its null count.
+
+        The null mask is built once and reused to feed the column's
+        non-null values to :meth:`_observe_values`.  ``n_null`` is passed
+        in when :meth:`_scan_numeric` already counted it; plain numpy
+        integer/boolean columns cannot hold missing values and are not
+        masked at all.  Only numpy / pandas vectorized calls are made, so
+        threads running this concurrently spend most of their time outside
+        the GIL.
+        """
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "biu":
+            self._observe_values(col, series.to_numpy(), is_text=False)
+            return 0
+        mask = series.isna().to_numpy()
+        self._observe_values(
+            col, series.to_numpy()[~mask], is_text=dtype.kind in "OSU",
+        )
+        return int(mask.sum()) if n_null is None else n_null
+
+    @staticmethod
+    def _compute_missingness(
+        summaries: list[ColumnSummary], n_rows: int,
+    ) -> dict[str, float]:
         """Compute the percentage of missing values per column.
 
+        Parameters
+        ----------
+        summaries : list[ColumnSummary]
+            Per-column summaries carrying each column's null count.
+        n_rows : int
+            Number of rows inspected (the sample size, when sampling).
+
         Returns
         -------
         dict[str, float]
@@ -153,67 +868,127 @@ class SchemaProfiler:
             A value of ``0.0`` means no missing values; ``100.0`` means
             the entire column is null.
         """
-        if len(self._df) == 0:
-            return {col: 0.0 for col in self._df.columns}
+        if n_rows == 0:
+            return {summary.name: 0.0 for summary in summaries}
 
-        missing_pct = (
-            self._df.isnull().sum() / len(self._df) * 100
-        ).round(2)
+        return {
+            summary.name: round(summary.n_null / n_rows * 100, 2)
+            for summary in summaries
+        }
 
-        return missing_pct.to_dict()
+    def _compute_numeric_stats(self) -> dict[str, dict[str, Optional[float]]]:
+        """Return ``min``, ``max``, ``mean`` and ``std`` per numeric column.
 
-    def _detect_time_columns(self) -> list[str]:
-        """Identify columns whose names suggest temporal data.
+        ``std`` is the sample standard deviation (``ddof=1``, as in
+        ``DataFrame.describe``), derived from the merged ``M2``.
+        Columns that were promoted to a non-numeric dtype by a later chunk
+        are dropped.  Statistics that are undefined (e.g. of an all-null
+        column) are ``None`` so the profile stays valid JSON.
+        """
+        stats: dict[str, dict[str, Optional[float]]] = {}
+        for col in self._columns:
+            summary = self._numeric.get(col)
+            if summary is None or self._dtypes.get(col) == "object":
+                continue
+            lo, hi, mean, m2, n_valid = summary
+            std = math.sqrt(m2 / (n_valid - 1)) if n_valid > 1 else None
+            stats[col] = {
+                "min": None if math.isnan(lo) else lo,
+                "max": None if math.isnan(hi) else hi,
+                "mean": mean if n_valid else None,
+                "std": std,
+            }
+        return stats
 
-        Detection is purely keyword-based against ``_TIME_KEYWORDS``.
-        No value inspection is performed.
+    def _detect_semantic_types(
+        self, summaries: list[ColumnSummary],
+    ) -> dict[str, str]:
+        """Return the semantic type of each text column that has one.
 
-        Returns
-        -------
-        list[str]
-            Column names that matched at least one time keyword.
+        A type is assigned when at least ``_SEMANTIC_MIN_SHARE`` of the
+        column's checked values match it; if several qualify, the one with
+        the most matches wins (earlier types on ties).
         """
-        matches: list[str] = []
-        for col in self._df.columns:
-            # Split on underscores and check each token.
-            tokens = set(col.lower().split("_"))
-            if tokens & _TIME_KEYWORDS:
-                matches.append(col)
+        detected: dict[str, str] = {}
+        for summary in summaries:
+            if not summary.semantic_checked:
+                continue
+            hits = summary.semantic_hits
+            best = max(SEMANTIC_TYPES, key=hits.__getitem__)
+            if hits[best] >= _SEMANTIC_MIN_SHARE * summary.semantic_checked:
+                detected[summary.name] = best
 
-        if matches:
-            logger.info("Detected potential time columns: %s", matches)
-        return matches
+        if detected:
+            logger.info("Detected semantic types: %s", detected)
+        return detected
 
-    def _detect_geo_columns(self) -> list[str]:
-        """Identify columns whose names suggest geographic data.
+    def _detect_datetime_formats(
+        self, summaries: list[ColumnSummary],
+    ) -> dict[str, str]:
+        """Return the date format of each text column that holds dates.
+
+        Only the summary's leading values are inspected: the format is
+        guessed from the first one, and the column qualifies when more than
+        ``_DATETIME_MIN_SHARE`` of them parse with it.  Columns whose first
+        value has no recognizable format are rejected without parsing.
+        The format is kept in the profile so a later full conversion can
+        pass ``format=`` instead of inferring it per value.
+        """
+        formats: dict[str, str] = {}
+        for summary in summaries:
+            if summary.dtype_kind not in ("O", "U") or not summary.first_values:
+                continue
+            fmt = _cheap_datetime_format(summary.first_values)
+            if fmt is not None:
+                formats[summary.name] = fmt
 
-        Detection is purely keyword-based against ``_GEO_KEYWORDS``.
-        No value inspection is performed.
+        if formats:
+            logger.info("Detected date columns by value: %s", formats)
+        return formats
+
+    def _detect_keyword_columns(
+        self, summaries: list[ColumnSummary],
+    ) -> tuple[list[str], list[str]]:
+        """Identify columns whose names suggest temporal or geographic data.
+
+        Detection is purely keyword-based against ``_TIME_KEYWORDS`` and
+        ``_GEO_KEYWORDS``; no value inspection is performed.  Each summary's
+        name tokens are tested with a C-level ``frozenset.isdisjoint``.
 
         Returns
         -------
-        list[str]
-            Column names that matched at least one geography keyword.
+        tuple[list[str], list[str]]
+            ``(time_columns, geo_columns)`` — column names that matched at
+            least one time / geography keyword.
         """
-        matches: list[str] = []
-        for col in self._df.columns:
-            tokens = set(col.lower().split("_"))
-            if tokens & _GEO_KEYWORDS:
-                matches.append(col)
+        time_matches: list[str] = [
+            summary.name for summary in summaries
+            if not _TIME_KEYWORDS.isdisjoint(summary.tokens)
+        ]
+        geo_matches: list[str] = [
+            summary.name for summary in summaries
+            if not _GEO_KEYWORDS.isdisjoint(summary.tokens)
+        ]
 
-        if matches:
-            logger.info("Detected potential geo columns: %s", matches)
-        return matches
+        if time_matches:
+            logger.info("Detected potential time columns: %s", time_matches)
+        if geo_matches:
+            logger.info("Detected potential geo columns: %s", geo_matches)
+        return time_matches, geo_matches
 
     def _detect_column_roles(
-        self, time_cols: list[str], geo_cols: list[str],
+        self,
+        summaries: list[ColumnSummary],
+        time_cols: list[str],
+        geo_cols: list[str],
     ) -> dict[str, str]:
         """Classify each column as ``'key'``, ``'metric'``, or ``'dimension'``.
 
         Rules:
             - Time and geo columns are always ``'key'``.
             - Columns whose name contains an ID keyword are ``'key'``.
-            - Remaining numeric columns are ``'metric'``.
+            - Remaining numeric columns (numpy or Arrow-backed) are
+              ``'metric'``.
             - Everything else is ``'dimension'``.
 
         Returns
@@ -224,18 +999,95 @@ class SchemaProfiler:
         key_cols = set(time_cols) | set(geo_cols)
         roles: dict[str, str] = {}
 
-        for col in self._df.columns:
-            if col in key_cols:
-                roles[col] = "key"
-                continue
-            tokens = set(col.lower().split("_"))
-            if tokens & _ID_KEYWORDS:
-                roles[col] = "key"
-                continue
-            dtype_str = str(self._df[col].dtype)
-            if "int" in dtype_str or "float" in dtype_str:
-                roles[col] = "metric"
+        for summary in summaries:
+            if summary.name in key_cols or not _ID_KEYWORDS.isdisjoint(summary.tokens):
+                roles[summary.name] = "key"
+            elif summary.dtype_kind in ("i", "u", "f"):
+                roles[summary.name] = "metric"
             else:
-                roles[col] = "dimension"
+                roles[summary.name] = "dimension"
 
         return roles
+
+
+def _cheap_datetime_format(values: list[str]) -> Optional[str]:
+    """Return the date format shared by *values*, or ``None``.
+
+    The format is guessed from the first value only; if there is one, all
+    values are parsed with it in a single vectorized call — Arrow's
+    ``strptime`` kernel when pyarrow is available, otherwise a cached
+    ``pd.to_datetime``.
+    """
+    with warnings.catch_warnings():
+        # Day-first dates trigger a "dayfirst=False" UserWarning; the
+        # guessed format already encodes the order.
+        warnings.simplefilter("ignore", UserWarning)
+        fmt = guess_datetime_format(values[0].strip())
+    if fmt is None:
+        return None
+    # Arrow's strptime has no %f (fractional seconds); pandas handles those.
+    if pc is not None and "%f" not in fmt:
+        try:
+            parsed = pc.strptime(
+                pc.utf8_trim_whitespace(pa.array(values, type=pa.string())),
+                format=fmt,
+                unit="us",
+                error_is_null=True,
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+        else:
+            share = (len(parsed) - parsed.null_count) / len(parsed)
+            return fmt if share > _DATETIME_MIN_SHARE else None
+    parsed = pd.to_datetime(
+        pd.Series(values).str.strip(), format=fmt, errors="coerce", cache=True,
+    )
+    return fmt if parsed.notna().mean() > _DATETIME_MIN_SHARE else None
+
+
+def _polars_dtype_name(dtype: "pl.DataType") -> str:
+    """Return the ``[pyarrow]`` pandas dtype name for a Polars dtype.
+
+    Goes through the Arrow type Polars exports, so names match the other
+    profiling paths (``Int64`` → ``int64[pyarrow]``).  Polars' ``String`` and
+    ``Binary`` export as the ``large_`` Arrow variants; they are reported as
+    ``string`` / ``binary``, as the Arrow CSV reader types them.
+    """
+    import polars as pl
+
+    arrow_type = pl.Series(dtype=dtype).to_arrow().type
+    if pa.types.is_large_string(arrow_type):
+        arrow_type = pa.string()
+    elif pa.types.is_large_binary(arrow_type):
+        arrow_type = pa.binary()
+    return str(pd.ArrowDtype(arrow_type))
+
+
+def _dtype_kind(dtype_str: str) -> str:
+    """Return the NumPy-style kind of a profile dtype string.
+
+    Understands numpy, pandas extension and ``[pyarrow]`` dtype names;
+    ``"unknown"`` maps to ``""`` and anything unparseable to ``"O"``.
+    """
+    if dtype_str == "unknown":
+        return ""
+    try:
+        return pandas_dtype(dtype_str).kind
+    except (TypeError, ValueError):
+        return "O"
+
+
+def _promote_dtype(current: str, new: str) -> str:
+    """Return the dtype string that can hold values of both dtypes.
+
+    Numeric/boolean dtypes are promoted with numpy's rules (``int64`` +
+    ``float64`` → ``float64``); any other disagreement becomes ``object``,
+    which is what ``pd.read_csv`` reports for a mixed column.
+    """
+    try:
+        a, b = np.dtype(current), np.dtype(new)
+    except TypeError:
+        return "object"
+    if a.kind in "biuf" and b.kind in "biuf":
+        return np.promote_types(a, b).name
+    return "object"
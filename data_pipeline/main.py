@@ -7,10 +7,14 @@ CLI entry point that orchestrates the full ingestion + cleaning + merge pipeline
     1. Parse command-line arguments (file path, dataset name, optional flags).
     2. Load the raw dataset via :class:`DatasetLoader`.
     3. Generate schema profile (dataset_profile) via :class:`SchemaProfiler`.
+       When nothing downstream needs the rows (no cleaning, no merge), CSVs
+       are streamed through the profiler in Arrow batches instead, so the
+       full DataFrame is never built.
     4. Optionally run cleaning: call OpenAI cleaning agent, execute code safely,
        log transformations, write cleaned dataset to data/cleaned/.
     5. Register the dataset via :class:`DatasetRegistry`.
-    6. Save dataset_profile JSON to ``data/processed/{name}_profile.json``.
+    6. Save dataset_profile JSON to ``data/processed/{name}_profile.json``
+       (``.json.zst`` with ``--compress``).
     7. If ``--merge-with`` is given, detect join keys with the target dataset,
        normalize keys, merge, validate, and save the result.
 
@@ -19,38 +23,79 @@ Usage::
     python -m data_pipeline --file data/raw/irs_990_2020.csv --name irs_990_2020
     python -m data_pipeline --file data/raw/irs_990_2020.csv --name irs_990_2020 --no-clean
     python -m data_pipeline --file data/raw/unemp.csv --name unemp --merge-with irs_990_2020
+    python -m data_pipeline --manifest datasets.csv --no-clean
+
+With ``--manifest``, each ``file,name`` line of the manifest is ingested in
+its own worker process; the registry is flushed once by the parent after
+all workers finish.
 
 Exit codes:
     0  — success
     1  — error during ingestion or merge
 """
 
-import argparse
 import json
 import logging
 import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 from data_pipeline.config import (
     CLEANED_DATA_DIR,
+    DEFAULT_PROFILE_SAMPLE_ROWS,
+    FSYNC_OUTPUTS,
     MERGED_DATA_DIR,
     PROCESSED_DATA_DIR,
     setup_logging,
 )
-from data_pipeline.ingestion.loader import DatasetLoader
-from data_pipeline.ingestion.schema import SchemaProfiler
-from data_pipeline.ingestion.registry import DatasetRegistry
-from data_pipeline.cleaning.agent import CleaningAgent
-from data_pipeline.cleaning.executor import SafeCleaningExecutor
-from data_pipeline.cleaning.transform_log import TransformationLog
 
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed; use the stdlib json module
+
+if TYPE_CHECKING:
+    import argparse
 
+    import pandas as pd
 
-def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    from data_pipeline.ingestion.registry import DatasetRegistry
+
+logger = logging.getLogger(__name__)
+
+# Flags understood by the fast argv scan: option → (attribute, takes value).
+# Keep in sync with _build_parser(); anything not listed here (``--help``,
+# ``--flag=value``, typos) is handed to argparse.
+_FAST_FLAGS: dict[str, tuple[str, bool]] = {
+    "--file": ("file", True),
+    "-f": ("file", True),
+    "--name": ("name", True),
+    "-n": ("name", True),
+    "--no-clean": ("no_clean", False),
+    "--merge-with": ("merge_with", True),
+    "--as-context": ("as_context", False),
+    "--profile-sample": ("profile_sample", True),
+    "--engine": ("engine", True),
+    "--compress": ("compress", False),
+    "--manifest": ("manifest", True),
+}
+
+_ENGINES: tuple[str, ...] = ("pandas", "polars")
+
+
+def parse_args(
+    argv: list[str] | None = None,
+) -> "argparse.Namespace | SimpleNamespace":
     """Parse command-line arguments.
 
+    The common case (known flags, each followed by its value) is handled by
+    a plain scan of ``argv`` so a one-shot run never imports ``argparse``.
+    Anything else — ``--help``, ``--flag=value``, unknown or malformed
+    arguments — goes through the full argparse parser, which also produces
+    the usual usage and error messages.
+
     Parameters
     ----------
     argv : list[str], optional
@@ -58,22 +103,88 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
     Returns
     -------
-    argparse.Namespace
-        Parsed arguments with ``file``, ``name``, and optional merge attributes.
+    argparse.Namespace or SimpleNamespace
+        Parsed arguments with ``file`` and ``name`` (or ``manifest``), and
+        optional merge attributes.
     """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    args = _parse_args_fast(argv)
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+        error = _check_args(vars(args))
+        if error is not None:
+            parser.error(error)
+    return args
+
+
+def _check_args(values: dict[str, object]) -> str | None:
+    """Validate flag combinations argparse cannot express; return an error."""
+    if values["manifest"] is None:
+        if values["file"] is None or values["name"] is None:
+            return "--file and --name are required unless --manifest is given"
+    elif values["file"] is not None or values["name"] is not None:
+        return "--manifest cannot be combined with --file / --name"
+    elif values["merge_with"] is not None:
+        return "--merge-with is not supported with --manifest"
+    if values["profile_sample"] < 0:
+        return "--profile-sample must be 0 (every row) or a positive row count"
+    return None
+
+
+def _parse_args_fast(argv: list[str]) -> SimpleNamespace | None:
+    """Scan *argv* for the known flags; return ``None`` to defer to argparse."""
+    values: dict[str, object] = {
+        "file": None,
+        "name": None,
+        "manifest": None,
+        "no_clean": False,
+        "merge_with": None,
+        "as_context": False,
+        "profile_sample": DEFAULT_PROFILE_SAMPLE_ROWS,
+        "engine": "pandas",
+        "compress": False,
+    }
+    it = iter(argv)
+    for arg in it:
+        spec = _FAST_FLAGS.get(arg)
+        if spec is None:
+            return None
+        dest, takes_value = spec
+        if takes_value:
+            value = next(it, None)
+            if value is None or value.startswith("-"):
+                return None
+            values[dest] = value
+        else:
+            values[dest] = True
+
+    if values["engine"] not in _ENGINES:
+        return None
+    try:
+        values["profile_sample"] = int(values["profile_sample"])
+    except ValueError:
+        return None
+    if _check_args(values) is not None:
+        return None
+    return SimpleNamespace(**values)
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the full argparse parser (help text, validation, errors)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="norp-ingest",
         description="Ingest a raw dataset into the NORP data pipeline.",
     )
     parser.add_argument(
         "--file", "-f",
-        required=True,
         type=str,
-        help="Path to the raw data file (CSV, Excel, or JSON).",
+        help="Path to the raw data file (CSV, Excel, JSON, Parquet, or Feather).",
     )
     parser.add_argument(
         "--name", "-n",
-        required=True,
         type=str,
         help=(
             "A short, descriptive name for the dataset "
@@ -103,7 +214,45 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
             "(the --merge-with dataset becomes primary)."
         ),
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--profile-sample",
+        type=int,
+        default=DEFAULT_PROFILE_SAMPLE_ROWS,
+        metavar="ROWS",
+        help=(
+            "Maximum number of rows to inspect when profiling "
+            f"(default: {DEFAULT_PROFILE_SAMPLE_ROWS:,}; 0 profiles every row)."
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        choices=_ENGINES,
+        default="pandas",
+        help=(
+            "Engine used to profile when no cleaning or merge needs the rows "
+            "in memory: 'polars' profiles CSV, Parquet and Feather files with "
+            "one lazy, streaming query (requires polars). Default: pandas."
+        ),
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help=(
+            "Write the profile as zstd-compressed {name}_profile.json.zst "
+            "instead of plain JSON (requires zstandard)."
+        ),
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Ingest every 'file,name' line of PATH in parallel worker "
+            "processes instead of a single --file / --name."
+        ),
+    )
+    return parser
 
 
 def ingest(
@@ -113,6 +262,10 @@ def ingest(
     run_cleaning: bool = True,
     merge_with: str | None = None,
     as_context: bool = False,
+    profile_sample_rows: int | None = DEFAULT_PROFILE_SAMPLE_ROWS,
+    engine: str = "pandas",
+    compress: bool = False,
+    flush_registry: bool = True,
 ) -> None:
     """Run the full ingestion + cleaning + merge pipeline for a single dataset.
 
@@ -131,6 +284,21 @@ def ingest(
         Name of a registered dataset to merge with after ingestion.
     as_context : bool, optional
         If True, the newly ingested dataset is context (merge_with is primary).
+    profile_sample_rows : int, optional
+        Maximum number of rows the schema profiler inspects.  ``None``
+        profiles every row; ``num_rows`` is always the full count.
+    engine : str, optional
+        ``"pandas"`` (default) or ``"polars"``.  With ``"polars"``, a
+        profile-only run of a CSV/TSV, Parquet or Feather file scans it
+        lazily and profiles it in one Polars query; other formats, and runs
+        that clean or merge, still load with pandas.
+    compress : bool, optional
+        If True, write the profile zstd-compressed (level 3) to
+        ``{dataset_name}_profile.json.zst`` instead of plain JSON.
+    flush_registry : bool, optional
+        If True (default), rebuild ``registry.json`` after registering.
+        Workers of :func:`ingest_many` pass False and only append to the
+        registry journal; the parent flushes once at the end.
 
     Raises
     ------
@@ -141,24 +309,69 @@ def ingest(
     RuntimeError
         If loading fails after all encoding attempts.
     """
+    if compress:
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise RuntimeError("--compress requires the zstandard package.") from exc
+
+    # Imported here rather than at module level so ``--help`` and argument
+    # errors return before pandas / pyarrow are loaded.
+    from data_pipeline.ingestion.loader import DatasetLoader
+    from data_pipeline.ingestion.registry import DatasetRegistry
+    from data_pipeline.ingestion.schema import SchemaProfiler
+
     logger.info("=" * 60)
     logger.info("Starting ingestion: %s", dataset_name)
     logger.info("Source file: %s", file_path)
     logger.info("=" * 60)
 
-    # ---- Step 1: Load dataset ----------------------------------------
+    # ---- Steps 1-2: Load dataset + generate schema profile ------------
+    # Cleaning and merging need the rows; otherwise only the profile does,
+    # and it can be built one Arrow batch at a time.
     loader = DatasetLoader(file_path)
-    df = loader.load()
-
-    # ---- Step 2: Generate schema profile (dataset_profile) ------------
-    profiler = SchemaProfiler(df)
-    profile = profiler.generate_profile()
+    needs_frame = bool(merge_with) or (
+        run_cleaning and bool(os.environ.get("OPENAI_API_KEY"))
+    )
+    df = None
+    profile = None
+    if engine == "polars":
+        if needs_frame:
+            logger.info("Cleaning/merging needs a pandas frame; ignoring --engine polars.")
+        elif not loader.supports_lazy_scan:
+            logger.info(
+                "--engine polars cannot scan %s; using the pandas engine.",
+                Path(file_path).name,
+            )
+        else:
+            profile = SchemaProfiler.from_lazy_frame(
+                loader.load_lazy(), sample_rows=profile_sample_rows,
+            ).finalize()
+    if profile is None and not needs_frame and loader.supports_arrow_streaming:
+        profiler = SchemaProfiler(sample_rows=profile_sample_rows)
+        try:
+            for batch in loader.iter_arrow_batches():
+                profiler.update(batch)
+            profile = profiler.finalize()
+        except (ValueError, NotImplementedError) as exc:
+            # NotImplementedError covers pa.ArrowNotImplementedError (a
+            # type no Arrow kernel handles) without importing pyarrow here.
+            logger.warning("Streaming profile failed (%s); loading in full.", exc)
+
+    if profile is None:
+        df = loader.load()
+        profiler = SchemaProfiler(df, sample_rows=profile_sample_rows)
+        profile = profiler.generate_profile()
 
     cleaned_file_path: Path | None = None
     transform_log_path: Path | None = None
     cleaning_succeeded = False
     if run_cleaning and os.environ.get("OPENAI_API_KEY"):
         # ---- Step 3a: Cleaning agent + safe execution + logging -------
+        from data_pipeline.cleaning.agent import CleaningAgent
+        from data_pipeline.cleaning.executor import SafeCleaningExecutor
+        from data_pipeline.cleaning.transform_log import TransformationLog
+
         tlog = TransformationLog(dataset_name=dataset_name)
         tlog.start_run()
         agent = CleaningAgent()
@@ -216,26 +429,50 @@ def ingest(
         cleaned_file_path=cleaned_file_path,
         transform_log_path=transform_log_path,
     )
+    if flush_registry:
+        registry.flush()
 
     # ---- Step 5: Save dataset_profile JSON ---------------------------
     profile_path = PROCESSED_DATA_DIR / f"{dataset_name}_profile.json"
-    with open(profile_path, "w", encoding="utf-8") as fh:
-        json.dump(profile, fh, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        payload = orjson.dumps(
+            profile,
+            option=(
+                orjson.OPT_INDENT_2
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NON_STR_KEYS
+            ),
+        )
+    else:
+        payload = json.dumps(profile, indent=2, ensure_ascii=False).encode("utf-8")
+    if compress:
+        # Key names repeat for every column, so level 3 already shrinks
+        # wide profiles several-fold at close to memcpy speed.
+        profile_path = profile_path.with_name(profile_path.name + ".zst")
+        payload = zstandard.ZstdCompressor(level=3, threads=-1).compress(payload)
+    _write_file(profile_path, payload)
 
     logger.info("dataset_profile saved to: %s", profile_path)
 
     # ---- Summary -----------------------------------------------------
-    logger.info("-" * 60)
-    logger.info("Ingestion complete for '%s'", dataset_name)
-    logger.info("  Rows       : %d", profile["num_rows"])
-    logger.info("  Columns    : %d", profile["num_columns"])
-    logger.info("  Time cols  : %s", profile["time_columns"])
-    logger.info("  Geo cols   : %s", profile["geo_columns"])
-    if cleaned_file_path:
-        logger.info("  Cleaned    : %s", cleaned_file_path)
-    if transform_log_path:
-        logger.info("  Transforms : %s", transform_log_path)
-    logger.info("-" * 60)
+    # One pre-formatted record instead of one per line: each logging call
+    # pays for its own format / encode / flush, which adds up when
+    # ingest() runs over many small files.
+    if logger.isEnabledFor(logging.INFO):
+        lines = [
+            "-" * 60,
+            f"Ingestion complete for '{dataset_name}'",
+            f"  Rows       : {profile['num_rows']}",
+            f"  Columns    : {profile['num_columns']}",
+            f"  Time cols  : {profile['time_columns']}",
+            f"  Geo cols   : {profile['geo_columns']}",
+        ]
+        if cleaned_file_path:
+            lines.append(f"  Cleaned    : {cleaned_file_path}")
+        if transform_log_path:
+            lines.append(f"  Transforms : {transform_log_path}")
+        lines.append("-" * 60)
+        logger.info("%s", "\n".join(lines))
 
     # ---- Step 6: Merge (if --merge-with) -----------------------------
     if merge_with:
@@ -249,11 +486,125 @@ def ingest(
         )
 
 
+def ingest_many(
+    jobs: list[tuple[str, str]],
+    *,
+    max_workers: int | None = None,
+    **options: object,
+) -> list[str]:
+    """Ingest several files in parallel, one worker process per file.
+
+    Each worker runs the single-file :func:`ingest` pipeline, so pandas /
+    pyarrow are imported once per worker rather than once per file.
+    Workers only append to the registry journal; the registry JSON is
+    rebuilt once here after all of them finish.
+
+    Parameters
+    ----------
+    jobs : list[tuple[str, str]]
+        ``(file_path, dataset_name)`` pairs.
+    max_workers : int, optional
+        Upper bound on worker processes (default: ``os.cpu_count()``).
+    **options
+        Keyword arguments forwarded to :func:`ingest` for every file
+        (``merge_with`` is not supported).
+
+    Returns
+    -------
+    list[str]
+        Names of the datasets whose ingestion failed (empty on success).
+    """
+    from data_pipeline.ingestion.registry import DatasetRegistry
+
+    tasks = [(file_path, name, options) for file_path, name in jobs]
+    workers = min(len(tasks), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        errors = [_ingest_one(task) for task in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        logger.info("Ingesting %d dataset(s) with %d worker(s).", len(tasks), workers)
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=setup_logging,
+        ) as pool:
+            errors = list(pool.map(_ingest_one, tasks))
+
+    DatasetRegistry().flush()
+    return [name for (_, name), error in zip(jobs, errors) if error is not None]
+
+
+def _ingest_one(task: tuple[str, str, dict]) -> str | None:
+    """Worker for :func:`ingest_many`; returns an error message or ``None``."""
+    file_path, dataset_name, options = task
+    try:
+        ingest(file_path, dataset_name, flush_registry=False, **options)
+    except (FileNotFoundError, ValueError, RuntimeError) as exc:
+        logger.error("Ingestion of '%s' failed: %s", dataset_name, exc)
+        return str(exc)
+    except Exception as exc:
+        logger.exception("Unexpected error ingesting '%s': %s", dataset_name, exc)
+        return str(exc)
+    return None
+
+
+def _read_manifest(path: str) -> list[tuple[str, str]]:
+    """Read ``file,name`` pairs from a manifest file.
+
+    Blank lines and lines starting with ``#`` are skipped.
+
+    Raises
+    ------
+    ValueError
+        If a line is malformed, a name repeats, or no files are listed.
+    """
+    import csv
+
+    jobs: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    with open(path, newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        for row in reader:
+            if not any(cell.strip() for cell in row) or row[0].lstrip().startswith("#"):
+                continue
+            if len(row) != 2:
+                raise ValueError(
+                    f"{path}:{reader.line_num}: expected 'file,name', got {row!r}"
+                )
+            file_path, name = row[0].strip(), row[1].strip()
+            if name in seen:
+                raise ValueError(f"{path}:{reader.line_num}: duplicate name '{name}'")
+            seen.add(name)
+            jobs.append((file_path, name))
+    if not jobs:
+        raise ValueError(f"{path}: manifest lists no files")
+    return jobs
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write *data* to *path*, replacing any existing file.
+
+    The bytes are already encoded, so they go straight to the file
+    descriptor with ``os.write`` (looping on short writes) instead of
+    through a text or buffered file object.  ``fsync`` is only called
+    when ``NORP_FSYNC=1`` (see :data:`FSYNC_OUTPUTS`).
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if FSYNC_OUTPUTS:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 def _run_merge(
     *,
-    registry: DatasetRegistry,
+    registry: "DatasetRegistry",
     current_name: str,
-    current_df,
+    current_df: "pd.DataFrame",
     current_profile: dict,
     merge_with: str,
     as_context: bool,
@@ -263,7 +614,7 @@ def _run_merge(
     Loads the target dataset from the registry, detects join keys,
     normalizes them, merges, validates, and saves results.
     """
-    import pandas as pd  # noqa: F811 — used by DatasetLoader internally
+    from data_pipeline.ingestion.loader import DatasetLoader
     from data_pipeline.merging.join_detector import JoinDetector
     from data_pipeline.merging.merge_engine import MergeEngine
 
@@ -342,14 +693,18 @@ def _run_merge(
     )
 
     # --- Final summary ------------------------------------------------
-    logger.info("-" * 60)
-    logger.info("Merge complete: '%s' + '%s'", primary_name, context_name)
-    logger.info("  Merged rows : %d", len(result.merged_df))
-    logger.info("  Merged cols : %d", len(result.merged_df.columns))
-    logger.info("  Key coverage: %s", result.report.get("key_coverage", {}))
-    logger.info("  Saved to    : %s", merged_path)
-    logger.info("  Report      : %s", report_path)
-    logger.info("-" * 60)
+    if logger.isEnabledFor(logging.INFO):
+        msg = "\n".join([
+            "-" * 60,
+            f"Merge complete: '{primary_name}' + '{context_name}'",
+            f"  Merged rows : {len(result.merged_df)}",
+            f"  Merged cols : {len(result.merged_df.columns)}",
+            f"  Key coverage: {result.report.get('key_coverage', {})}",
+            f"  Saved to    : {merged_path}",
+            f"  Report      : {report_path}",
+            "-" * 60,
+        ])
+        logger.info("%s", msg)
 
 
 def main() -> None:
@@ -357,14 +712,34 @@ def main() -> None:
     setup_logging()
 
     args = parse_args()
+    options = {
+        "run_cleaning": not args.no_clean,
+        "profile_sample_rows": args.profile_sample or None,
+        "engine": args.engine,
+        "compress": args.compress,
+    }
+
+    if args.manifest is not None:
+        try:
+            jobs = _read_manifest(args.manifest)
+        except (OSError, ValueError) as exc:
+            logger.error("Invalid manifest: %s", exc)
+            sys.exit(1)
+        failed = ingest_many(jobs, **options)
+        if failed:
+            logger.error(
+                "%d of %d dataset(s) failed: %s", len(failed), len(jobs), failed,
+            )
+            sys.exit(1)
+        return
 
     try:
         ingest(
             file_path=args.file,
             dataset_name=args.name,
-            run_cleaning=not args.no_clean,
             merge_with=args.merge_with,
             as_context=args.as_context,
+            **options,
         )
     except (FileNotFoundError, ValueError, RuntimeError) as exc:
         logger.error("Ingestion failed: %s", exc)